@@ -10,6 +10,7 @@ import argparse
 import traceback
 import csv
 from decimal import Decimal
+from types import SimpleNamespace
 from typing import Tuple
 
 from lighter.signer_client import SignerClient
@@ -19,14 +20,14 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from exchanges.nado import NadoClient
 import websockets
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 
-class Config:
+class Config(SimpleNamespace):
     """Simple config class to wrap dictionary for Nado client."""
     def __init__(self, config_dict):
-        for key, value in config_dict.items():
-            setattr(self, key, value)
+        # SimpleNamespace sets the attributes in C, without a Python
+        # setattr loop, and brings a useful repr for free
+        super().__init__(**config_dict)
 
 
 class HedgeBot:
@@ -184,7 +185,7 @@ class HedgeBot:
 
     def log_trade_to_csv(self, exchange: str, side: str, price: str, quantity: str):
         """Log trade details to CSV file."""
-        timestamp = datetime.now(pytz.UTC).isoformat()
+        timestamp = datetime.now(timezone.utc).isoformat()
 
         with open(self.csv_filename, 'a', newline='') as csvfile:
             writer = csv.writer(csvfile)
@@ -3,13 +3,15 @@ import json
 import signal
 import logging
 import os
+import queue
 import sys
 import time
 import argparse
 import traceback
 import csv
-import aiohttp
 from decimal import Decimal
+from logging.handlers import QueueHandler, QueueListener
+from types import SimpleNamespace
 from typing import Tuple
 
 import sys
@@ -18,17 +20,18 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from exchanges.grvt import GrvtClient
 from exchanges.aster import AsterClient
-from datetime import datetime
-import pytz
+from helpers.http import get_shared_session, close_shared_session
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 
 load_dotenv('.grvt_aster_env')
 
-class Config:
+class Config(SimpleNamespace):
     """Simple config class to wrap dictionary for exchange clients."""
     def __init__(self, config_dict):
-        for key, value in config_dict.items():
-            setattr(self, key, value)
+        # SimpleNamespace sets the attributes in C, without a Python
+        # setattr loop, and brings a useful repr for free
+        super().__init__(**config_dict)
 
 
 class HedgeBot:
@@ -94,9 +97,13 @@ class HedgeBot:
         file_handler.setFormatter(file_formatter)
         console_handler.setFormatter(console_formatter)
 
-        # Add handlers to logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Route records through a queue so logger calls on the event-loop
+        # thread never block on file/console writes
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._log_listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True)
+        self._log_listener.start()
 
         # Prevent propagation to root logger to avoid duplicate messages and external logs
         self.logger.propagate = False
@@ -123,6 +130,13 @@ class HedgeBot:
         # Order execution tracking
         self.order_execution_complete = False
 
+        # Event mirrors of the completion flags so the trading loop can
+        # await the WebSocket callbacks instead of polling every 10ms;
+        # stop_event mirrors stop_flag so those waits break on shutdown
+        self.execution_complete_event = asyncio.Event()
+        self.aster_fill_ready_event = asyncio.Event()
+        self.stop_event = asyncio.Event()
+
         # Current order details for immediate execution
         self.current_aster_side = None
         self.current_aster_quantity = None
@@ -150,6 +164,7 @@ class HedgeBot:
     def shutdown(self, signum=None, frame=None):
         """Graceful shutdown handler."""
         self.stop_flag = True
+        self.stop_event.set()
         self.logger.info("\n🛑 Stopping...")
 
         # Close WebSocket connections
@@ -165,7 +180,25 @@ class HedgeBot:
             except Exception as e:
                 self.logger.error(f"Error disconnecting Aster WebSocket: {e}")
 
-        # Close logging handlers properly
+        # Close the trade CSV handle
+        try:
+            if self._csv_file:
+                self._csv_file.close()
+                self._csv_file = None
+        except Exception:
+            pass
+
+        # Stop the log listener (flushes queued records), then close the
+        # real handlers it was feeding
+        try:
+            if self._log_listener:
+                self._log_listener.stop()
+                for handler in self._log_listener.handlers:
+                    handler.close()
+                self._log_listener = None
+        except Exception:
+            pass
+
         for handler in self.logger.handlers[:]:
             try:
                 handler.close()
@@ -174,25 +207,26 @@ class HedgeBot:
                 pass
 
     def _initialize_csv_file(self):
-        """Initialize CSV file with headers if it doesn't exist."""
-        if not os.path.exists(self.csv_filename):
-            with open(self.csv_filename, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['exchange', 'timestamp', 'side', 'price', 'quantity'])
+        """Open the trade CSV once, writing headers if the file is new."""
+        self._csv_file = open(self.csv_filename, 'a', newline='', buffering=1 << 16)
+        if self._csv_file.tell() == 0:
+            self._csv_file.write('exchange,timestamp,side,price,quantity\r\n')
+            self._csv_file.flush()
+        self._csv_writer = csv.writer(self._csv_file)
 
     def log_trade_to_csv(self, exchange: str, side: str, price: str, quantity: str):
         """Log trade details to CSV file."""
-        timestamp = datetime.now(pytz.UTC).isoformat()
-
-        with open(self.csv_filename, 'a', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([
-                exchange,
-                timestamp,
-                side,
-                price,
-                quantity
-            ])
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+        self._csv_writer.writerow([
+            exchange,
+            timestamp,
+            side,
+            price,
+            quantity
+        ])
+        # Trades are rare and precious - flush so a crash can't lose them
+        self._csv_file.flush()
 
         self.logger.info(f"📊 Trade logged to CSV: {exchange} {side} {quantity} @ {price}")
 
@@ -218,13 +252,14 @@ class HedgeBot:
                 "priority": priority
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, data=data) as response:
-                    if response.status == 200:
-                        self.logger.info(f"✅ Pushover alert sent: {title}")
-                    else:
-                        result = await response.text()
-                        self.logger.error(f"❌ Failed to send Pushover alert: {response.status} - {result}")
+            # Shared keep-alive session: no per-alert TCP+TLS handshake
+            session = await get_shared_session()
+            async with session.post(url, data=data) as response:
+                if response.status == 200:
+                    self.logger.info(f"✅ Pushover alert sent: {title}")
+                else:
+                    result = await response.text()
+                    self.logger.error(f"❌ Failed to send Pushover alert: {response.status} - {result}")
         except Exception as e:
             self.logger.error(f"❌ Error sending Pushover alert: {e}")
 
@@ -255,9 +290,10 @@ class HedgeBot:
                 quantity=str(filled_size)
             )
 
-            # Mark execution as complete
+            # Mark execution as complete and wake the trading loop
             self.aster_order_filled = True
             self.order_execution_complete = True
+            self.execution_complete_event.set()
 
         except Exception as e:
             self.logger.error(f"Error handling Aster order result: {e}")
@@ -380,8 +416,12 @@ class HedgeBot:
             open_spread = (grvt_ask - aster_ask) / grvt_ask
             close_spread = (grvt_bid - aster_bid) / grvt_bid
         """
-        grvt_bid, grvt_ask = await self.fetch_grvt_bbo_prices()
-        aster_bid, aster_ask = await self.fetch_aster_bbo_prices()
+        # Fetch both books concurrently so the spread snapshot costs
+        # max(RTT) instead of the sum of both round-trips
+        (grvt_bid, grvt_ask), (aster_bid, aster_ask) = await asyncio.gather(
+            self.fetch_grvt_bbo_prices(),
+            self.fetch_aster_bbo_prices()
+        )
 
         if grvt_ask == 0 or grvt_bid == 0:
             raise Exception("Invalid GRVT prices")
@@ -483,6 +523,7 @@ class HedgeBot:
         }
 
         self.waiting_for_aster_fill = True
+        self.aster_fill_ready_event.set()
 
     async def place_aster_market_order(self, aster_side: str, quantity: Decimal, price: Decimal):
         """Place market order on Aster for hedging."""
@@ -592,6 +633,7 @@ class HedgeBot:
                 self.aster_order_filled = True
                 self.waiting_for_aster_fill = False
                 self.order_execution_complete = True
+                self.execution_complete_event.set()
                 break
 
             await asyncio.sleep(0.1)
@@ -845,6 +887,8 @@ class HedgeBot:
 
             self.order_execution_complete = False
             self.waiting_for_aster_fill = False
+            self.execution_complete_event.clear()
+            self.aster_fill_ready_event.clear()
             try:
                 # Open position
                 await self.place_grvt_post_only_order(side, self.order_quantity)
@@ -853,21 +897,7 @@ class HedgeBot:
                 self.logger.error(f"⚠️ Full traceback: {traceback.format_exc()}")
                 break
 
-            start_time = time.time()
-            while not self.order_execution_complete and not self.stop_flag:
-                # Check if GRVT order filled and we need to place Aster order
-                if self.waiting_for_aster_fill:
-                    await self.place_aster_market_order(
-                        self.current_aster_side,
-                        self.current_aster_quantity,
-                        self.current_aster_price
-                    )
-                    break
-
-                await asyncio.sleep(0.01)
-                if time.time() - start_time > 180:
-                    self.logger.error("❌ Timeout waiting for trade completion")
-                    break
+            await self._wait_for_hedge_completion()
 
             if self.stop_flag:
                 break
@@ -886,6 +916,8 @@ class HedgeBot:
             self.logger.info(f"[STEP 2] GRVT position: {self.grvt_position} | Aster position: {self.aster_position}")
             self.order_execution_complete = False
             self.waiting_for_aster_fill = False
+            self.execution_complete_event.clear()
+            self.aster_fill_ready_event.clear()
             try:
                 side = 'buy' if self.initial_direction == 'sell' else 'sell'
                 await self.place_grvt_post_only_order(side, self.order_quantity)
@@ -894,26 +926,14 @@ class HedgeBot:
                 self.logger.error(f"⚠️ Full traceback: {traceback.format_exc()}")
                 break
 
-            start_time = time.time()
-            while not self.order_execution_complete and not self.stop_flag:
-                # Check if GRVT order filled and we need to place Aster order
-                if self.waiting_for_aster_fill:
-                    await self.place_aster_market_order(
-                        self.current_aster_side,
-                        self.current_aster_quantity,
-                        self.current_aster_price
-                    )
-                    break
-
-                await asyncio.sleep(0.01)
-                if time.time() - start_time > 180:
-                    self.logger.error("❌ Timeout waiting for trade completion")
-                    break
+            await self._wait_for_hedge_completion()
 
             # Close remaining position
             self.logger.info(f"[STEP 3] GRVT position: {self.grvt_position} | Aster position: {self.aster_position}")
             self.order_execution_complete = False
             self.waiting_for_aster_fill = False
+            self.execution_complete_event.clear()
+            self.aster_fill_ready_event.clear()
             if self.grvt_position == 0:
                 continue
             elif self.grvt_position > 0:
@@ -928,21 +948,37 @@ class HedgeBot:
                 self.logger.error(f"⚠️ Full traceback: {traceback.format_exc()}")
                 break
 
-            start_time = time.time()
-            while not self.order_execution_complete and not self.stop_flag:
-                # Check if GRVT order filled and we need to place Aster order
-                if self.waiting_for_aster_fill:
-                    await self.place_aster_market_order(
-                        self.current_aster_side,
-                        self.current_aster_quantity,
-                        self.current_aster_price
-                    )
-                    break
+            await self._wait_for_hedge_completion()
 
-                await asyncio.sleep(0.01)
-                if time.time() - start_time > 180:
-                    self.logger.error("❌ Timeout waiting for trade completion")
-                    break
+    async def _wait_for_hedge_completion(self):
+        """Wait for the hedge leg after a GRVT order, dispatching if needed.
+
+        Shared by all three trading-loop steps: parks on the callback
+        events and places the Aster market order when the GRVT fill
+        arrived but the hedge hasn't been executed yet.
+        """
+        if self.stop_flag:
+            return
+        waiters = [
+            asyncio.create_task(self.aster_fill_ready_event.wait()),
+            asyncio.create_task(self.execution_complete_event.wait()),
+            asyncio.create_task(self.stop_event.wait()),
+        ]
+        done, pending = await asyncio.wait(
+            waiters, timeout=180, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        if self.stop_flag:
+            return
+        if not done:
+            self.logger.error("❌ Timeout waiting for trade completion")
+        elif (self.waiting_for_aster_fill and
+              not self.order_execution_complete and not self.stop_flag):
+            await self.place_aster_market_order(
+                self.current_aster_side,
+                self.current_aster_quantity,
+                self.current_aster_price
+            )
 
     async def run(self):
         """Run the hedge bot."""
@@ -954,6 +990,10 @@ class HedgeBot:
             self.logger.info("\n🛑 Received interrupt signal...")
         finally:
             self.logger.info("🔄 Cleaning up...")
+            try:
+                await close_shared_session()
+            except Exception as e:
+                self.logger.error(f"Error closing HTTP session: {e}")
             self.shutdown()
 
 
@@ -0,0 +1,39 @@
+"""Shared HTTP session for outbound requests (Pushover, webhooks, etc.)."""
+import logging
+from typing import Optional
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Get the process-wide aiohttp ClientSession, creating it lazily.
+
+    All async outbound HTTP in the process shares one connector, so each
+    origin keeps a single pool of keep-alive TLS connections instead of
+    every helper opening its own.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+    return _session
+
+
+async def close_shared_session():
+    """Close the process-wide session (call on graceful shutdown)."""
+    global _session
+    if _session and not _session.closed:
+        try:
+            await _session.close()
+        except Exception as e:
+            logger.error(f"Error closing shared HTTP session: {e}")
+    _session = None
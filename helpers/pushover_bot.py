@@ -4,14 +4,16 @@ import aiohttp
 import os
 from typing import Optional
 
+from .http import get_shared_session, close_shared_session
+
 
 class PushoverBot:
     """Helper class for sending Pushover notifications."""
 
-    def __init__(self, user_key: Optional[str] = None, api_token: Optional[str] = None, 
+    def __init__(self, user_key: Optional[str] = None, api_token: Optional[str] = None,
                  logger: Optional[logging.Logger] = None):
         """Initialize Pushover bot.
-        
+
         Args:
             user_key: Pushover user key (defaults to PUSHOVER_USER_KEY env var)
             api_token: Pushover API token (defaults to PUSHOVER_API_TOKEN env var)
@@ -21,6 +23,21 @@ class PushoverBot:
         self.api_token = api_token or os.getenv('PUSHOVER_API_TOKEN')
         self.logger = logger or logging.getLogger(__name__)
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the process-wide shared HTTP session.
+
+        Reusing one session keeps the TCP+TLS connection to api.pushover.net
+        alive between alerts instead of paying a full handshake per call.
+        """
+        return await get_shared_session()
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        try:
+            await close_shared_session()
+        except Exception as e:
+            self.logger.error(f"Error closing Pushover session: {e}")
+
     async def send_alert(self, title: str, message: str, priority: int = 0,
                         retry: int = 30, expire: int = 3600) -> bool:
         """Send alert via Pushover.
@@ -54,16 +71,16 @@ class PushoverBot:
                 data["retry"] = max(30, retry)  # Minimum 30 seconds
                 data["expire"] = min(10800, expire)  # Maximum 3 hours
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, data=data) as response:
-                    if response.status == 200:
-                        self.logger.info(f"✅ Pushover alert sent: {title}")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        self.logger.error(
-                            f"❌ Failed to send Pushover alert: {response.status} - {error_text}")
-                        return False
+            session = await self._get_session()
+            async with session.post(url, data=data) as response:
+                if response.status == 200:
+                    self.logger.info(f"✅ Pushover alert sent: {title}")
+                    return True
+                else:
+                    error_text = await response.text()
+                    self.logger.error(
+                        f"❌ Failed to send Pushover alert: {response.status} - {error_text}")
+                    return False
         except Exception as e:
             self.logger.error(f"❌ Error sending Pushover alert: {e}")
             return False
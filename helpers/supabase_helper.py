@@ -1,7 +1,31 @@
 """Supabase helper for reading configuration data."""
 import os
+import threading
+import time
+import orjson
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Dict, Any, List, Tuple
+
+# Connect/read timeouts for every REST call so a slow Supabase response
+# can't wedge bot startup indefinitely
+_REQUEST_TIMEOUT = (5, 10)
+
+# Negative cache: missing config keys are remembered for longer than
+# positive results and persisted across restarts, so supervisor restart
+# loops don't re-query Supabase for a key known to return nothing.
+# Lives next to the positive cache (not /tmp, which any local user
+# could pre-create) and obeys the same SUPABASE_NO_CACHE switch.
+_NEG_CACHE_PATH = os.path.expanduser('~/.cache/cross_exchange_arbitrage/supabase_neg_cache.json')
+_NEG_CACHE_TTL = 300.0
+
+# On-disk cache for fetched config rows: crash-restart loops within the
+# TTL reload config from disk instead of the network. Disable with
+# SUPABASE_NO_CACHE=1.
+_DISK_CACHE_PATH = os.path.expanduser('~/.cache/cross_exchange_arbitrage/supabase_cache.json')
+_DISK_CACHE_TTL = 300.0
 
 
 class SupabaseHelper:
@@ -16,9 +40,11 @@ class SupabaseHelper:
         
         Uses direct HTTP requests to Supabase REST API (PostgREST).
         """
-        self.supabase_url = os.getenv('SUPABASE_URL')
-        self.supabase_api_key = os.getenv('SUPABASE_API_KEY')
-        self.supabase_secret_key = os.getenv('SUPABASE_SECRET_KEY')
+        # Single environ snapshot instead of repeated os.getenv calls
+        env = os.environ
+        self.supabase_url = env.get('SUPABASE_URL')
+        self.supabase_api_key = env.get('SUPABASE_API_KEY')
+        self.supabase_secret_key = env.get('SUPABASE_SECRET_KEY')
         
         if not self.supabase_url:
             raise ValueError(
@@ -41,9 +67,172 @@ class SupabaseHelper:
             "apikey": self.api_key,
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
-            "Prefer": "return=representation"
+            # count=none skips PostgREST's extra count query per request
+            "Prefer": "count=none, return=representation"
         }
-    
+
+        # Endpoint URLs are fixed per table; build them once instead of
+        # re-formatting the same string on every call
+        self._master_url = f"{self.rest_url}/maker_taker_master"
+        self._detail_url = f"{self.rest_url}/maker_taker_detail"
+
+        # Persistent session with keep-alive so repeated lookups reuse
+        # one pooled TLS connection instead of handshaking per request.
+        # The adapter is sized for the concurrent bundle fetch so both
+        # queries get a pooled connection without blocking each other,
+        # and retries transient 5xx/connect errors with a short backoff.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # TTL result cache: the config tables are small and read-mostly,
+        # so repeated reads within the TTL are served from memory
+        self._cache: Dict[tuple, Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_ttl = 60.0
+
+        # Single-flight map: one fetch per key at a time, concurrent
+        # callers for the same key wait on it instead of duplicating
+        # the network request
+        self._inflight: Dict[tuple, threading.Event] = {}
+
+        # SUPABASE_NO_CACHE=1 disables both persisted layers below
+        self._disk_cache_enabled = env.get('SUPABASE_NO_CACHE') != '1'
+
+        # Persisted negative cache (missing keys), see _NEG_CACHE_PATH
+        self._neg_cache = self._load_neg_cache() if self._disk_cache_enabled else {}
+
+        # Persisted positive cache so restarts within the TTL skip the
+        # network entirely; maps key string -> [timestamp, result]
+        self._disk_cache = self._load_disk_cache() if self._disk_cache_enabled else {}
+
+    @staticmethod
+    def _load_neg_cache() -> Dict[str, float]:
+        """Load the persisted negative cache, dropping expired entries."""
+        try:
+            with open(_NEG_CACHE_PATH, 'rb') as f:
+                data = orjson.loads(f.read())
+            now = time.time()
+            return {k: ts for k, ts in data.items()
+                    if isinstance(ts, (int, float)) and now - ts < _NEG_CACHE_TTL}
+        except Exception:
+            return {}
+
+    def _save_neg_cache(self):
+        """Persist the negative cache so it survives process restarts."""
+        if not self._disk_cache_enabled:
+            return
+        try:
+            os.makedirs(os.path.dirname(_NEG_CACHE_PATH), exist_ok=True)
+            with open(_NEG_CACHE_PATH, 'wb') as f:
+                f.write(orjson.dumps(self._neg_cache))
+        except Exception:
+            pass
+
+    @staticmethod
+    def _load_disk_cache() -> Dict[str, list]:
+        """Load the persisted config cache, dropping expired entries."""
+        try:
+            with open(_DISK_CACHE_PATH, 'rb') as f:
+                data = orjson.loads(f.read())
+            now = time.time()
+            return {k: v for k, v in data.items()
+                    if isinstance(v, list) and len(v) == 2 and now - v[0] < _DISK_CACHE_TTL}
+        except Exception:
+            return {}
+
+    def _save_disk_cache(self):
+        """Persist fetched config rows so restarts within the TTL skip the network."""
+        try:
+            os.makedirs(os.path.dirname(_DISK_CACHE_PATH), exist_ok=True)
+            with open(_DISK_CACHE_PATH, 'wb') as f:
+                f.write(orjson.dumps(self._disk_cache))
+        except Exception:
+            pass
+
+    @staticmethod
+    def from_env():
+        """Build the right helper for the current environment.
+
+        Set SUPABASE_MODE=mock to serve config from a local fixtures file
+        (SUPABASE_FIXTURES, default fixtures/config.json) instead of the
+        network — zero-latency config load for tests and offline runs.
+
+        Returns:
+            SupabaseHelper or LocalSupabaseHelper instance
+        """
+        if os.getenv('SUPABASE_MODE') == 'mock':
+            return LocalSupabaseHelper()
+        return SupabaseHelper()
+
+    def _cached(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """Return a cached result for key, calling fetch() on miss/expiry.
+
+        Concurrent callers with the same key are coalesced into a single
+        network request: the first caller fetches, the rest wait and read
+        the freshly cached value. Keys known to be missing are answered
+        from the (persisted) negative cache without touching the network.
+        """
+        neg_key = '|'.join(map(str, key))
+        with self._cache_lock:
+            neg_ts = self._neg_cache.get(neg_key)
+            if neg_ts and time.time() - neg_ts < _NEG_CACHE_TTL:
+                return None
+
+        while True:
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry and time.monotonic() - entry[0] < self._cache_ttl:
+                    return entry[1]
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    waiter = threading.Event()
+                    self._inflight[key] = waiter
+                    break
+            # Another thread is already fetching this key; wait for it to
+            # finish, then re-check the cache (or fetch if it failed)
+            waiter.wait()
+
+        try:
+            # Disk layer: a restart within the TTL reuses the last
+            # fetched rows without touching the network
+            if self._disk_cache_enabled:
+                with self._cache_lock:
+                    entry = self._disk_cache.get(neg_key)
+                if entry and time.time() - entry[0] < _DISK_CACHE_TTL:
+                    result = entry[1]
+                    with self._cache_lock:
+                        self._cache[key] = (time.monotonic(), result)
+                    return result
+
+            result = fetch()
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic(), result)
+                if result is None:
+                    self._neg_cache[neg_key] = time.time()
+                    self._save_neg_cache()
+                else:
+                    self._neg_cache.pop(neg_key, None)
+                    if self._disk_cache_enabled:
+                        self._disk_cache[neg_key] = [time.time(), result]
+                        self._save_disk_cache()
+            return result
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+            waiter.set()
+
     def get_maker_taker_master(self, config_key: str) -> Optional[Dict[str, Any]]:
         """Get master configuration from maker_taker_master table.
         
@@ -53,15 +242,20 @@ class SupabaseHelper:
         Returns:
             Dictionary containing the configuration data, or None if not found
         """
+        return self._cached(
+            ('master', config_key), lambda: self._fetch_maker_taker_master(config_key))
+
+    def _fetch_maker_taker_master(self, config_key: str) -> Optional[Dict[str, Any]]:
+        """Fetch master configuration from the REST API (uncached)."""
         try:
             # Direct REST API call to PostgREST
-            url = f"{self.rest_url}/maker_taker_master"
+            url = self._master_url
             params = {"config_key": f"eq.{config_key}"}
             
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self._session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             if data and len(data) > 0:
                 return data[0]
             return None
@@ -81,18 +275,26 @@ class SupabaseHelper:
         Returns:
             Dictionary containing the configuration data, or None if not found
         """
+        return self._cached(
+            ('detail', config_key, symbol),
+            lambda: self._fetch_maker_taker_detail(config_key, symbol))
+
+    def _fetch_maker_taker_detail(
+        self, config_key: str, symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch detail configuration from the REST API (uncached)."""
         try:
             # Direct REST API call to PostgREST
-            url = f"{self.rest_url}/maker_taker_detail"
+            url = self._detail_url
             params = {
                 "config_key": f"eq.{config_key}",
                 "symbol": f"eq.{symbol}"
             }
             
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self._session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             if data and len(data) > 0:
                 return data[0]
             return None
@@ -100,6 +302,66 @@ class SupabaseHelper:
         except Exception as e:
             raise Exception(f"Error fetching maker_taker_detail: {e}")
     
+    def get_maker_taker_bundle(
+        self, config_key: str, symbol: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Get master and detail configuration in one round-trip of latency.
+
+        Issues the maker_taker_master and maker_taker_detail queries
+        concurrently so config load time is max(RTT) instead of sum(RTT).
+
+        Args:
+            config_key: The configuration key to query
+            symbol: The trading symbol (e.g., 'BTC', 'ETH')
+
+        Returns:
+            Tuple of (master_config, detail_config), either may be None
+        """
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            master_future = pool.submit(self.get_maker_taker_master, config_key)
+            detail_future = pool.submit(self.get_maker_taker_detail, config_key, symbol)
+            return master_future.result(), detail_future.result()
+
+    def get_maker_taker_details_for(
+        self, config_key: str, symbols: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get detail configurations for several symbols in one request.
+
+        Uses a PostgREST IN filter so launching N symbols costs one
+        round-trip instead of N.
+
+        Args:
+            config_key: The configuration key to query
+            symbols: Trading symbols (e.g., ['BTC', 'ETH'])
+
+        Returns:
+            Dictionary mapping symbol to its detail configuration
+        """
+        rows = self._cached(
+            ('details_for', config_key, tuple(sorted(symbols))),
+            lambda: self._fetch_maker_taker_details_for(config_key, symbols))
+        return {row['symbol']: row for row in rows or []}
+
+    def _fetch_maker_taker_details_for(
+        self, config_key: str, symbols: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Fetch detail configurations for symbols from the REST API (uncached)."""
+        try:
+            # Direct REST API call to PostgREST with an IN filter
+            url = self._detail_url
+            params = {
+                "config_key": f"eq.{config_key}",
+                "symbol": f"in.({','.join(symbols)})"
+            }
+
+            response = self._session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
+            response.raise_for_status()
+
+            return orjson.loads(response.content)
+
+        except Exception as e:
+            raise Exception(f"Error fetching maker_taker_details for symbols: {e}")
+
     def get_all_maker_taker_details(
         self, config_key: str
     ) -> List[Dict[str, Any]]:
@@ -111,15 +373,21 @@ class SupabaseHelper:
         Returns:
             List of dictionaries containing the configuration data
         """
+        return self._cached(
+            ('all_details', config_key),
+            lambda: self._fetch_all_maker_taker_details(config_key))
+
+    def _fetch_all_maker_taker_details(self, config_key: str) -> List[Dict[str, Any]]:
+        """Fetch all detail configurations from the REST API (uncached)."""
         try:
             # Direct REST API call to PostgREST
-            url = f"{self.rest_url}/maker_taker_detail"
+            url = self._detail_url
             params = {"config_key": f"eq.{config_key}"}
             
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self._session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            return response.json()
+            return orjson.loads(response.content)
             
         except Exception as e:
             raise Exception(f"Error fetching maker_taker_details: {e}")
@@ -130,3 +398,66 @@ class SupabaseHelper:
 
 
 
+
+
+class LocalSupabaseHelper:
+    """Offline helper serving configuration from a local fixtures file.
+
+    Drop-in replacement for SupabaseHelper's read API, selected via
+    SUPABASE_MODE=mock. The fixtures file is JSON with two keys,
+    "maker_taker_master" and "maker_taker_detail", each a list of rows in
+    the same shape the REST API returns. Config load becomes a single
+    local file read — no network, no latency.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Load fixture rows from disk.
+
+        Args:
+            path: Fixtures file path (defaults to SUPABASE_FIXTURES env
+                var, then fixtures/config.json)
+        """
+        self.path = path or os.getenv('SUPABASE_FIXTURES', 'fixtures/config.json')
+        try:
+            with open(self.path, 'rb') as f:
+                fixtures = orjson.loads(f.read())
+        except Exception as e:
+            raise Exception(f"Error loading Supabase fixtures from {self.path}: {e}")
+
+        self._masters: List[Dict[str, Any]] = fixtures.get('maker_taker_master', [])
+        self._details: List[Dict[str, Any]] = fixtures.get('maker_taker_detail', [])
+
+    def get_maker_taker_master(self, config_key: str) -> Optional[Dict[str, Any]]:
+        """Get master configuration for config_key from the fixtures."""
+        for row in self._masters:
+            if row.get('config_key') == config_key:
+                return row
+        return None
+
+    def get_maker_taker_detail(
+        self, config_key: str, symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get detail configuration for (config_key, symbol) from the fixtures."""
+        for row in self._details:
+            if row.get('config_key') == config_key and row.get('symbol') == symbol:
+                return row
+        return None
+
+    def get_maker_taker_bundle(
+        self, config_key: str, symbol: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Get master and detail configuration from the fixtures."""
+        return (self.get_maker_taker_master(config_key),
+                self.get_maker_taker_detail(config_key, symbol))
+
+    def get_maker_taker_details_for(
+        self, config_key: str, symbols: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get detail configurations for several symbols from the fixtures."""
+        wanted = set(symbols)
+        return {row['symbol']: row for row in self._details
+                if row.get('config_key') == config_key and row.get('symbol') in wanted}
+
+    def get_all_maker_taker_details(self, config_key: str) -> List[Dict[str, Any]]:
+        """Get all detail configurations for config_key from the fixtures."""
+        return [row for row in self._details if row.get('config_key') == config_key]
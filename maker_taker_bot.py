@@ -1,19 +1,83 @@
 """Main entry point for arbitrage bot with Supabase configuration."""
 import asyncio
 import argparse
+import importlib
 import os
 import sys
+from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
 from dotenv import load_dotenv
 
-print("Loading modules...")
-sys.stdout.flush()
+# Default detail-config values, precomputed as Decimals at import time so
+# create_grvt_aster_bot doesn't rebuild Decimal(str(float)) per field
+DETAIL_DEFAULTS = {
+    'order_quantity': Decimal('0.001'),
+    'max_position': Decimal('0.1'),
+    'long_threshold': Decimal('10'),
+    'short_threshold': Decimal('10'),
+}
 
-from strategy_grvt.grvt_arb import GrvtArb
-from helpers.supabase_helper import SupabaseHelper
 
-print("Modules loaded successfully!")
-sys.stdout.flush()
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """Per-symbol trading parameters, converted from Supabase JSON once."""
+    order_quantity: Decimal
+    max_position: Decimal
+    long_threshold: Decimal
+    short_threshold: Decimal
+    z_score_multiplier: float
+
+    @classmethod
+    def from_supabase(cls, detail_config: dict) -> 'BotConfig':
+        """Build a config from a maker_taker_detail row, applying defaults."""
+        return cls(
+            order_quantity=_detail_decimal(detail_config, 'order_quantity'),
+            max_position=_detail_decimal(detail_config, 'max_position'),
+            long_threshold=_detail_decimal(detail_config, 'long_threshold'),
+            short_threshold=_detail_decimal(detail_config, 'short_threshold'),
+            z_score_multiplier=float(detail_config.get('z_score_multiplier', 1.5)),
+        )
+
+
+# Env files already loaded this process, so repeated bot creation in one
+# process doesn't re-read and re-parse the same dotenv file
+_loaded_env_files = set()
+
+
+def _load_env_once(env_file: str, override: bool = False):
+    """Load a dotenv file, skipping the read if it was already loaded."""
+    if env_file in _loaded_env_files:
+        return
+    load_dotenv(env_file, override=override)
+    _loaded_env_files.add(env_file)
+
+
+def _write_banner(lines: list):
+    """Emit a startup banner as one stdout write instead of a print per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _detail_decimal(detail_config: dict, key: str) -> Decimal:
+    """Get a detail-config field as Decimal, falling back to the default."""
+    value = detail_config.get(key)
+    if value is None:
+        return DETAIL_DEFAULTS[key]
+    return Decimal(str(value))
+
+
+@lru_cache(maxsize=1)
+def get_supabase_helper():
+    """Get the shared SupabaseHelper instance.
+
+    Caching the helper avoids re-reading env vars and re-creating the
+    HTTP session (and its TLS connection) on every lookup. The import is
+    deferred so `--help` and argument errors don't pay for it. Set
+    SUPABASE_MODE=mock to get the offline fixtures-backed helper.
+    """
+    from helpers.supabase_helper import SupabaseHelper
+    return SupabaseHelper.from_env()
 
 
 def create_grvt_aster_bot(symbol: str, master_config: dict, detail_config: dict):
@@ -27,58 +91,68 @@ def create_grvt_aster_bot(symbol: str, master_config: dict, detail_config: dict)
     Returns:
         GrvtArb instance
     """
-    # Extract configuration parameters
+    # Lazy import: the strategy stack (exchange SDKs, aiohttp) is heavy,
+    # so only load it once a bot is actually being created
+    from strategy_grvt.grvt_arb import GrvtArb
+
+    # Convert the Supabase row into typed parameters exactly once
     ticker = symbol
-    order_quantity = Decimal(str(detail_config.get('order_quantity', 0.001)))
-    max_position = Decimal(str(detail_config.get('max_position', 0.1)))
-    long_threshold = Decimal(str(detail_config.get('long_threshold', 10)))
-    short_threshold = Decimal(str(detail_config.get('short_threshold', 10)))
-    z_score_multiplier = float(detail_config.get('z_score_multiplier', 1.5))
-    
-    print(f"Creating GRVT-Aster arbitrage bot")
-    print(f"Ticker: {ticker}")
-    print(f"Order Quantity: {order_quantity}")
-    print(f"Max Position: {max_position}")
-    print(f"Long Threshold: {long_threshold}")
-    print(f"Short Threshold: {short_threshold}")
-    print(f"Z-Score Multiplier: {z_score_multiplier}")
-    print("-" * 50)
-    
+    config = BotConfig.from_supabase(detail_config)
+
+    _write_banner([
+        "Creating GRVT-Aster arbitrage bot",
+        f"Ticker: {ticker}",
+        f"Order Quantity: {config.order_quantity}",
+        f"Max Position: {config.max_position}",
+        f"Long Threshold: {config.long_threshold}",
+        f"Short Threshold: {config.short_threshold}",
+        f"Z-Score Multiplier: {config.z_score_multiplier}",
+        "-" * 50,
+    ])
+
     # Create and return bot
     return GrvtArb(
         ticker=ticker,
-        order_quantity=order_quantity,
-        max_position=max_position,
-        long_grvt_threshold=long_threshold,
-        short_grvt_threshold=short_threshold,
-        z_score_multiplier=z_score_multiplier
+        order_quantity=config.order_quantity,
+        max_position=config.max_position,
+        long_grvt_threshold=config.long_threshold,
+        short_grvt_threshold=config.short_threshold,
+        z_score_multiplier=config.z_score_multiplier
     )
 
 
-def create_bot_from_config(config_key: str, symbol: str):
+def create_bot_from_config(config_key: str, symbol: str, helper=None,
+                           master_config=None, detail_config=None):
     """Create bot instance based on Supabase configuration.
-    
+
     Args:
         config_key: Configuration key to query from Supabase
         symbol: Trading symbol (e.g., 'BTC', 'ETH')
-    
+        helper: Optional pre-built SupabaseHelper to reuse
+        master_config: Optional pre-fetched master config (skips the query)
+        detail_config: Optional pre-fetched detail config (skips the query)
+
     Returns:
         Bot instance based on maker_taker value
     """
-    # Initialize Supabase helper
-    helper = SupabaseHelper()
-    
-    # Get master configuration
-    print(f"Loading configuration for config_key: {config_key}")
-    master_config = helper.get_maker_taker_master(config_key)
-    
+    # Initialize Supabase helper (reuse the caller's if supplied)
+    if helper is None:
+        helper = get_supabase_helper()
+
+    # Get master and detail configuration concurrently, unless the caller
+    # already fetched them — avoids duplicate round-trips on cold start
+    if master_config is None or detail_config is None:
+        _write_banner([f"Loading configuration for config_key: {config_key}"])
+        fetched_master, fetched_detail = helper.get_maker_taker_bundle(config_key, symbol)
+        if master_config is None:
+            master_config = fetched_master
+        if detail_config is None:
+            detail_config = fetched_detail
+
     if not master_config:
         print(f"❌ Error: No master configuration found for config_key: {config_key}")
         sys.exit(1)
-    
-    # Get detail configuration for symbol
-    detail_config = helper.get_maker_taker_detail(config_key, symbol)
-    
+
     if not detail_config:
         print(f"❌ Error: No detail configuration found for config_key: {config_key}, symbol: {symbol}")
         sys.exit(1)
@@ -86,11 +160,13 @@ def create_bot_from_config(config_key: str, symbol: str):
     # Get maker_taker value
     maker_taker = master_config.get('maker_taker', '').lower()
     
-    print(f"✓ Configuration loaded successfully")
-    print(f"  Config Key: {config_key}")
-    print(f"  Symbol: {symbol}")
-    print(f"  Maker-Taker: {maker_taker}")
-    print("-" * 50)
+    _write_banner([
+        "✓ Configuration loaded successfully",
+        f"  Config Key: {config_key}",
+        f"  Symbol: {symbol}",
+        f"  Maker-Taker: {maker_taker}",
+        "-" * 50,
+    ])
     
     # Create bot based on maker_taker value
     if maker_taker == 'grvt_aster':
@@ -101,13 +177,25 @@ def create_bot_from_config(config_key: str, symbol: str):
     #     return create_other_bot(symbol, master_config, detail_config)
     
     else:
-        print(f"❌ Error: Unsupported maker_taker value: {maker_taker}")
-        print(f"Supported values: grvt_aster")
+        _write_banner([
+            f"❌ Error: Unsupported maker_taker value: {maker_taker}",
+            "Supported values: grvt_aster",
+        ])
         sys.exit(1)
 
 
-def main():
-    """Main function to run the arbitrage bot."""
+async def _amain():
+    """Async main: overlap config loading with the strategy import.
+
+    The Supabase round-trips and the (heavy) strategy-module import are
+    independent, so running them concurrently cuts cold-start time from
+    the sum of both to whichever is slower.
+    """
+    # On 3.12+ run new tasks eagerly until their first real suspend,
+    # skipping a scheduler round-trip per task on the hot tick paths
+    if hasattr(asyncio, 'eager_task_factory'):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Arbitrage Bot with Supabase Configuration')
     parser.add_argument('--config-key', type=str, required=True,
@@ -115,24 +203,50 @@ def main():
     parser.add_argument('--symbol', type=str, required=True,
                         help='Trading symbol (e.g., BTC, ETH)')
     args = parser.parse_args()
-    
+
+    # Kick off the heavy strategy import only once the args are known
+    # good: started earlier, --help/bad-args exits would block on the
+    # import thread during loop shutdown. It still overlaps env loading
+    # and the Supabase round-trips below.
+    import_task = asyncio.create_task(
+        asyncio.to_thread(importlib.import_module, 'strategy_grvt.grvt_arb'))
+
     # Load environment variables from .grvt_aster_env
-    load_dotenv('.grvt_aster_env')
-    
+    _load_env_once('.grvt_aster_env')
+
     # Get parameters
     config_key = args.config_key
     symbol = args.symbol.upper()
-    
-    print(f"Starting arbitrage bot")
-    print(f"Config Key: {config_key}")
-    print(f"Symbol: {symbol}")
-    print("=" * 50)
-    
-    # Create bot from Supabase configuration
-    bot = create_bot_from_config(config_key, symbol)
-    
-    # Run the bot
-    asyncio.run(bot.run())
+
+    _write_banner([
+        "Starting arbitrage bot",
+        f"Config Key: {config_key}",
+        f"Symbol: {symbol}",
+        "=" * 50,
+    ])
+
+    # Fetch configuration while the import finishes in the background;
+    # the lazy import inside create_grvt_aster_bot then hits sys.modules
+    bot, _ = await asyncio.gather(
+        asyncio.to_thread(create_bot_from_config, config_key, symbol),
+        import_task
+    )
+
+    # Run the bot on the same event loop
+    await bot.run()
+
+
+def main():
+    """Main function to run the arbitrage bot."""
+    # uvloop's libuv-backed loop is much faster for socket-heavy async
+    # work; fall back to stock asyncio where it isn't installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(_amain())
 
 
 if __name__ == "__main__":
@@ -4,8 +4,7 @@ import json
 import os
 import logging
 from decimal import Decimal
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 
 
 class DataLogger:
@@ -65,7 +64,7 @@ class DataLogger:
 
     def log_trade_to_csv(self, exchange: str, side: str, price: str, quantity: str):
         """Log trade details to CSV file."""
-        timestamp = datetime.now(pytz.UTC).isoformat()
+        timestamp = datetime.now(timezone.utc).isoformat()
 
         with open(self.csv_filename, 'a', newline='') as csvfile:
             writer = csv.writer(csvfile)
@@ -87,7 +86,7 @@ class DataLogger:
             # Fallback: reinitialize if file handle is lost
             self._initialize_bbo_csv_file()
 
-        timestamp = datetime.now(pytz.UTC).isoformat()
+        timestamp = datetime.now(timezone.utc).isoformat()
 
         # Calculate spreads
         long_maker_spread = (lighter_bid - maker_bid
@@ -8,6 +8,7 @@ import time
 import requests
 import traceback
 from decimal import Decimal
+from types import SimpleNamespace
 from typing import Tuple
 
 from lighter.signer_client import SignerClient
@@ -20,11 +21,12 @@ from .order_manager import OrderManager
 from .position_tracker import PositionTracker
 
 
-class Config:
+class Config(SimpleNamespace):
     """Simple config class to wrap dictionary for edgeX client."""
     def __init__(self, config_dict):
-        for key, value in config_dict.items():
-            setattr(self, key, value)
+        # SimpleNamespace sets the attributes in C, without a Python
+        # setattr loop, and brings a useful repr for free
+        super().__init__(**config_dict)
 
 
 class EdgexArb:
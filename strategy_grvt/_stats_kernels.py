@@ -0,0 +1,60 @@
+"""Batch statistics kernel for the spread-window code.
+
+One Welford pass producing mean/std/min/max over a float sequence. The
+best available implementation is picked at import time: with numba the
+loop is JIT-compiled (cached to disk, warmed at import so the first
+real call doesn't pay compilation); with only NumPy the vectorized
+array methods are used; otherwise a pure-Python loop runs on any
+sequence of floats. Callers should pass a float64 ndarray when NumPy is
+available and a list otherwise.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def welford_stats(a):
+    """One-pass mean/std/min/max over a float sequence.
+
+    Returns (mean, std, min, max, count); zeros for an empty input.
+    Uses population std (divide by n) like the rest of the spread code.
+    """
+    n = len(a)
+    if n == 0:
+        return 0.0, 0.0, 0.0, 0.0, 0
+    mean = 0.0
+    m2 = 0.0
+    mn = a[0]
+    mx = a[0]
+    for i in range(n):
+        x = a[i]
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += (x - mean) * delta
+        if x < mn:
+            mn = x
+        if x > mx:
+            mx = x
+    std = (m2 / n) ** 0.5 if n >= 2 else 0.0
+    return mean, std, mn, mx, n
+
+
+if njit is not None and np is not None:
+    welford_stats = njit(cache=True, fastmath=True)(welford_stats)
+    # Warm the compile (or the on-disk cache) at import time
+    welford_stats(np.zeros(1, dtype=np.float64))
+elif np is not None:
+    def welford_stats(a):  # noqa: F811 - vectorized replacement
+        """Vectorized mean/std/min/max over a float64 ndarray."""
+        n = len(a)
+        if n == 0:
+            return 0.0, 0.0, 0.0, 0.0, 0
+        std = float(a.std()) if n >= 2 else 0.0
+        return float(a.mean()), std, float(a.min()), float(a.max()), n
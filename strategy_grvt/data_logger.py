@@ -3,9 +3,47 @@ import csv
 import json
 import os
 import logging
+import queue
+import threading
+import time
 from decimal import Decimal
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
+
+# Optional columnar output: Parquet needs pyarrow, CSV stays the default
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Hoisted so the hot logging path never re-allocates Decimal('0')
+_ZERO = Decimal('0')
+
+if pa is not None:
+    _BBO_PQ_SCHEMA = pa.schema([
+        ('timestamp', pa.float64()),
+        ('maker_bid', pa.float64()),
+        ('maker_ask', pa.float64()),
+        ('taker_bid', pa.float64()),
+        ('taker_ask', pa.float64()),
+        ('long_maker_spread', pa.float64()),
+        ('short_maker_spread', pa.float64()),
+        ('long_maker', pa.bool_()),
+        ('short_maker', pa.bool_()),
+        ('long_maker_threshold', pa.float64()),
+        ('short_maker_threshold', pa.float64()),
+    ])
+    _SPREAD_PQ_SCHEMA = pa.schema([
+        ('timestamp', pa.float64()),
+        ('spread', pa.float64()),
+        ('spread_type', pa.string()),
+        ('moving_average', pa.float64()),
+        ('rolling_std', pa.float64()),
+        ('count', pa.int64()),
+        ('min', pa.float64()),
+        ('max', pa.float64()),
+    ])
 
 
 class DataLogger:
@@ -23,39 +61,212 @@ class DataLogger:
         self.spread_stats_csv_filename = f"logs/{exchange}_{ticker}_spread_stats.csv"
         self.thresholds_json_filename = f"logs/{exchange}_{ticker}_thresholds.json"
 
+        # Trade CSV file handles (kept open like the BBO/spread files)
+        self.trade_csv_file = None
+        self.trade_csv_writer = None
+
         # CSV file handles for efficient writing (kept open)
         self.bbo_csv_file = None
         self.bbo_csv_writer = None
         self.bbo_write_counter = 0
-        self.bbo_flush_interval = 10  # Flush every N writes
+        self.bbo_flush_interval = 256  # Flush every N writes (~a 4KB page of rows)
         
         # Spread stats CSV file handles
         self.spread_stats_csv_file = None
         self.spread_stats_csv_writer = None
         self.spread_stats_write_counter = 0
-        self.spread_stats_flush_interval = 10  # Flush every N writes
+        self.spread_stats_flush_interval = 256  # Flush every N writes (~a 4KB page of rows)
+
+        # Time cap on the count-gated flushes: low-rate streams (spread
+        # stats arrive at 2 rows per interval) would otherwise sit in
+        # the userspace buffer for many minutes before hitting disk
+        self.flush_max_age = 60.0
+        self._last_flush = {'bbo': 0.0, 'spread_stats': 0.0}
 
         self._initialize_csv_file()
         self._initialize_bbo_csv_file()
         self._initialize_spread_stats_csv_file()
 
+        # Timestamp cache: the second-resolution prefix only changes once
+        # a second, so only the sub-second part is formatted per row
+        self._ts_sec = 0
+        self._ts_prefix = ''
+
+        # BBO dedup: skip rows identical to the previous one, but still
+        # write a heartbeat row at least once a second
+        self._last_bbo_key = None
+        self._last_bbo_ts_ns = 0
+        self._bbo_dedup_window_ns = 1_000_000_000
+
+        # Decimal -> str memo: prices and thresholds repeat tick-to-tick
+        # and Decimal.__str__ is pure Python, so cache the conversions
+        self._dec_cache = {}
+
+        # Pre-joined BBO row suffix for the threshold pair: thresholds
+        # only change when the threshold coroutine recomputes, so the
+        # trailing ",long,short\r\n" fragment is reused between updates
+        self._thr_key = None
+        self._thr_suffix = ''
+
+        # Optional Parquet output (DATA_LOGGER_FORMAT=parquet, requires
+        # pyarrow): rows batch into typed columnar buffers and land in
+        # hourly-rotated Parquet files, far smaller than CSV on disk
+        self._parquet = (pa is not None and
+                         os.getenv('DATA_LOGGER_FORMAT', 'csv').lower() == 'parquet')
+        if self._parquet:
+            self._pq_buffers = {'bbo': [], 'spread_stats': []}
+            self._pq_schemas = {'bbo': _BBO_PQ_SCHEMA, 'spread_stats': _SPREAD_PQ_SCHEMA}
+            self._pq_writers = {}
+            self._pq_hours = {}
+
+        # Background writer: the async producers only enqueue rows, a
+        # dedicated thread does the csv/file I/O so a slow disk never
+        # blocks the event loop on a BBO tick. The queue is bounded so a
+        # stalled disk sheds log rows instead of growing without limit.
+        self._write_queue = queue.Queue(maxsize=10_000)
+        self._dropped_rows = 0
+        self._writer_thread = threading.Thread(target=self._writer_loop,
+                                               name=f'grvt-io-{ticker}', daemon=True)
+        self._writer_thread.start()
+
+    def _ts(self) -> str:
+        """Current UTC time in ISO format, with the second prefix cached."""
+        ns = time.time_ns()
+        sec = ns // 1_000_000_000
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_prefix = datetime.fromtimestamp(
+                sec, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+        return f"{self._ts_prefix}.{(ns % 1_000_000_000) // 1000:06d}+00:00"
+
+    def _s(self, d) -> str:
+        """Stringify a Decimal through a small bounded memo."""
+        cache = self._dec_cache
+        s = cache.get(d)
+        if s is None:
+            if len(cache) >= 4096:
+                cache.clear()
+            s = cache[d] = str(d)
+        return s
+
+    def _enqueue(self, item):
+        """Queue a row for the writer thread, dropping it if the queue is full."""
+        try:
+            self._write_queue.put_nowait(item)
+        except queue.Full:
+            # Logging is best-effort: shed rows rather than block trading
+            self._dropped_rows += 1
+            if self._dropped_rows % 1000 == 1:
+                self.logger.warning(
+                    f"⚠️ Log queue full, {self._dropped_rows} rows dropped so far")
+
+    def _writer_loop(self):
+        """Drain queued rows and write them in batches off the event loop."""
+        stop = False
+        while not stop:
+            item = self._write_queue.get()
+            # Group everything currently queued by stream so each batch
+            # goes out as one writerows call
+            batch = {}
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                stream, row = item
+                batch.setdefault(stream, []).append(row)
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+            for stream, rows in batch.items():
+                self._write_rows(stream, rows)
+
+    def _flush_due(self, stream) -> bool:
+        """True if the stream's buffer has gone unflushed past the age cap."""
+        return time.monotonic() - self._last_flush[stream] > self.flush_max_age
+
+    def _write_rows(self, stream, rows):
+        """Write a batch of rows for one stream (runs on the writer thread)."""
+        try:
+            if stream == 'bbo':
+                self.bbo_csv_file.writelines(rows)
+                self.bbo_write_counter += len(rows)
+                if (self.bbo_write_counter >= self.bbo_flush_interval
+                        or self._flush_due('bbo')):
+                    self.bbo_csv_file.flush()
+                    self.bbo_write_counter = 0
+                    self._last_flush['bbo'] = time.monotonic()
+            elif stream == 'trade':
+                self.trade_csv_writer.writerows(rows)
+                self.trade_csv_file.flush()
+            elif stream == 'spread_stats':
+                self.spread_stats_csv_file.writelines(rows)
+                self.spread_stats_write_counter += len(rows)
+                if (self.spread_stats_write_counter >= self.spread_stats_flush_interval
+                        or self._flush_due('spread_stats')):
+                    self.spread_stats_csv_file.flush()
+                    self.spread_stats_write_counter = 0
+                    self._last_flush['spread_stats'] = time.monotonic()
+            elif stream == 'bbo_pq':
+                self._append_parquet('bbo', rows, self.bbo_flush_interval)
+            elif stream == 'spread_stats_pq':
+                self._append_parquet('spread_stats', rows, self.spread_stats_flush_interval)
+        except Exception as e:
+            self.logger.error(f"❌ Error writing {stream} data to CSV: {e}")
+
+    def _append_parquet(self, name, rows, flush_interval):
+        """Buffer Parquet rows and flush full batches (writer thread only)."""
+        buf = self._pq_buffers[name]
+        buf.extend(rows)
+        if len(buf) >= flush_interval:
+            self._flush_parquet(name)
+
+    def _flush_parquet(self, name):
+        """Write the buffered rows for a stream into its hourly Parquet file."""
+        buf = self._pq_buffers[name]
+        if not buf:
+            return
+
+        # Rotate the writer on the hour boundary
+        hour = time.strftime('%Y%m%d_%H', time.gmtime())
+        writer = self._pq_writers.get(name)
+        if writer is None or self._pq_hours.get(name) != hour:
+            if writer is not None:
+                writer.close()
+            path = f"logs/{self.exchange}_{self.ticker}_{name}_{hour}.parquet"
+            writer = pq.ParquetWriter(path, self._pq_schemas[name])
+            self._pq_writers[name] = writer
+            self._pq_hours[name] = hour
+
+        schema = self._pq_schemas[name]
+        columns = list(zip(*buf))
+        batch = pa.record_batch(
+            [pa.array(col, type=field.type) for col, field in zip(columns, schema)],
+            schema=schema)
+        writer.write_batch(batch)
+        buf.clear()
+
     def _initialize_csv_file(self):
-        """Initialize CSV file with headers if it doesn't exist."""
-        if not os.path.exists(self.csv_filename):
-            with open(self.csv_filename, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['exchange', 'timestamp', 'side', 'price', 'quantity'])
+        """Initialize trade CSV file with headers if it doesn't exist."""
+        # Append mode creates the file, so a tell() on the fresh handle
+        # replaces the separate os.path.exists stat
+        self.trade_csv_file = open(self.csv_filename, 'a', newline='', buffering=8192)
+        self.trade_csv_writer = csv.writer(self.trade_csv_file)
+
+        # Write header only if file is new (empty)
+        if self.trade_csv_file.tell() == 0:
+            self.trade_csv_writer.writerow(['exchange', 'timestamp', 'side', 'price', 'quantity'])
+            self.trade_csv_file.flush()  # Ensure header is written immediately
 
     def _initialize_bbo_csv_file(self):
         """Initialize BBO CSV file with headers if it doesn't exist."""
-        file_exists = os.path.exists(self.bbo_csv_filename)
-
-        # Open file in append mode (will create if doesn't exist)
+        # Append mode creates the file, so a tell() on the fresh handle
+        # replaces the separate os.path.exists stat
         self.bbo_csv_file = open(self.bbo_csv_filename, 'a', newline='', buffering=8192)  # 8KB buffer
         self.bbo_csv_writer = csv.writer(self.bbo_csv_file)
 
-        # Write header only if file is new
-        if not file_exists:
+        # Write header only if file is new (empty)
+        if self.bbo_csv_file.tell() == 0:
             self.bbo_csv_writer.writerow([
                 'timestamp',
                 'maker_bid',
@@ -73,14 +284,13 @@ class DataLogger:
 
     def _initialize_spread_stats_csv_file(self):
         """Initialize spread statistics CSV file with headers if it doesn't exist."""
-        file_exists = os.path.exists(self.spread_stats_csv_filename)
-
-        # Open file in append mode (will create if doesn't exist)
+        # Append mode creates the file, so a tell() on the fresh handle
+        # replaces the separate os.path.exists stat
         self.spread_stats_csv_file = open(self.spread_stats_csv_filename, 'a', newline='', buffering=8192)
         self.spread_stats_csv_writer = csv.writer(self.spread_stats_csv_file)
 
-        # Write header only if file is new
-        if not file_exists:
+        # Write header only if file is new (empty)
+        if self.spread_stats_csv_file.tell() == 0:
             self.spread_stats_csv_writer.writerow([
                 'timestamp',
                 'spread',
@@ -95,17 +305,17 @@ class DataLogger:
 
     def log_trade_to_csv(self, exchange: str, side: str, price: str, quantity: str):
         """Log trade details to CSV file."""
-        timestamp = datetime.now(pytz.UTC).isoformat()
-
-        with open(self.csv_filename, 'a', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([
-                exchange,
-                timestamp,
-                side,
-                price,
-                quantity
-            ])
+        timestamp = self._ts()
+
+        # Hand the row to the writer thread; trades are rare and matter,
+        # so they are flushed as soon as they are written
+        self._enqueue(('trade', [
+            exchange,
+            timestamp,
+            side,
+            price,
+            quantity
+        ]))
 
         self.logger.info(f"📊 Trade logged to CSV: {exchange} {side} {quantity} @ {price}")
 
@@ -117,39 +327,62 @@ class DataLogger:
             # Fallback: reinitialize if file handle is lost
             self._initialize_bbo_csv_file()
 
-        timestamp = datetime.now(pytz.UTC).isoformat()
+        # Skip rows identical to the last one within the dedup window;
+        # top-of-book frequently repeats tick-to-tick
+        key = (maker_bid, maker_ask, taker_bid, taker_ask, long_maker,
+               short_maker, long_maker_threshold, short_maker_threshold)
+        now_ns = time.time_ns()
+        if key == self._last_bbo_key and now_ns - self._last_bbo_ts_ns < self._bbo_dedup_window_ns:
+            return
+        self._last_bbo_key = key
+        self._last_bbo_ts_ns = now_ns
 
-        # Calculate spreads
-        long_maker_spread = (taker_bid - maker_bid
-                             if taker_bid and taker_bid > 0 and maker_bid > 0
-                             else Decimal('0'))
-        short_maker_spread = (maker_ask - taker_ask
-                              if maker_ask > 0 and taker_ask and taker_ask > 0
-                              else Decimal('0'))
+        timestamp = self._ts()
 
-        try:
-            self.bbo_csv_writer.writerow([
-                timestamp,
-                str(maker_bid),
-                str(maker_ask),
-                str(taker_bid),
-                str(taker_ask),
-                str(long_maker_spread),
-                str(short_maker_spread),
-                long_maker,
-                short_maker,
-                str(long_maker_threshold),
-                str(short_maker_threshold)
-            ])
+        # Calculate spreads: compute unconditionally, then clamp to zero
+        # when either side of the book is missing/non-positive
+        if taker_bid and taker_bid > _ZERO and maker_bid > _ZERO:
+            long_maker_spread = taker_bid - maker_bid
+        else:
+            long_maker_spread = _ZERO
+        if taker_ask and maker_ask > _ZERO and taker_ask > _ZERO:
+            short_maker_spread = maker_ask - taker_ask
+        else:
+            short_maker_spread = _ZERO
 
-            # Increment write counter and flush periodically
-            self.bbo_write_counter += 1
-            if self.bbo_write_counter >= self.bbo_flush_interval:
-                self.bbo_csv_file.flush()
-                self.bbo_write_counter = 0
+        if self._parquet:
+            # Columnar path: enqueue typed values, the writer thread
+            # batches them into Arrow record batches
+            self._enqueue(('bbo_pq', (
+                time.time(),
+                float(maker_bid),
+                float(maker_ask),
+                float(taker_bid) if taker_bid else 0.0,
+                float(taker_ask) if taker_ask else 0.0,
+                float(long_maker_spread),
+                float(short_maker_spread),
+                bool(long_maker),
+                bool(short_maker),
+                float(long_maker_threshold),
+                float(short_maker_threshold),
+            )))
+            return
 
-        except Exception as e:
-            self.logger.error(f"❌ Error writing BBO data to CSV: {e}")
+        thr_key = (long_maker_threshold, short_maker_threshold)
+        if thr_key != self._thr_key:
+            self._thr_key = thr_key
+            self._thr_suffix = (
+                f"{self._s(long_maker_threshold)},"
+                f"{self._s(short_maker_threshold)}\r\n")
+
+        # Hand the encoded line to the writer thread; no csv-module
+        # dispatch or file I/O on this path (fields never need quoting)
+        self._enqueue(('bbo', (
+            f"{timestamp},{self._s(maker_bid)},{self._s(maker_ask)},"
+            f"{self._s(taker_bid)},{self._s(taker_ask)},"
+            f"{self._s(long_maker_spread)},{self._s(short_maker_spread)},"
+            f"{long_maker},{short_maker},{self._thr_suffix}"
+        )))
 
     def log_spread_stats_to_csv(self, spread: float, spread_type: str, 
                                 moving_average: float, rolling_std: float,
@@ -169,31 +402,82 @@ class DataLogger:
             # Fallback: reinitialize if file handle is lost
             self._initialize_spread_stats_csv_file()
 
-        timestamp = datetime.now(pytz.UTC).isoformat()
+        timestamp = self._ts()
 
-        try:
-            self.spread_stats_csv_writer.writerow([
-                timestamp,
-                f"{spread:.2f}",
+        if self._parquet:
+            # Columnar path: enqueue typed values, the writer thread
+            # batches them into Arrow record batches
+            self._enqueue(('spread_stats_pq', (
+                time.time(),
+                float(spread),
                 spread_type,
-                f"{moving_average:.2f}",
-                f"{rolling_std:.2f}",
-                count,
-                f"{min_spread:.2f}",
-                f"{max_spread:.2f}"
-            ])
+                float(moving_average),
+                float(rolling_std),
+                int(count),
+                float(min_spread),
+                float(max_spread),
+            )))
+            return
 
-            # Increment write counter and flush periodically
-            self.spread_stats_write_counter += 1
-            if self.spread_stats_write_counter >= self.spread_stats_flush_interval:
-                self.spread_stats_csv_file.flush()
-                self.spread_stats_write_counter = 0
+        # Hand the encoded line to the writer thread; no csv-module
+        # dispatch or file I/O on this path (fields never need quoting)
+        self._enqueue(('spread_stats', (
+            f"{timestamp},{spread:.2f},{spread_type},{moving_average:.2f},"
+            f"{rolling_std:.2f},{count},{min_spread:.2f},{max_spread:.2f}\r\n"
+        )))
 
-        except Exception as e:
-            self.logger.error(f"❌ Error writing spread stats to CSV: {e}")
+    def log_spread_stats_bulk(self, rows):
+        """Log several spread-stat rows with one timestamp and one enqueue.
+
+        Each row is a (spread, spread_type, moving_average, rolling_std,
+        count, min_spread, max_spread) tuple, matching the argument order
+        of log_spread_stats_to_csv.
+        """
+        if not rows:
+            return
+        if not self.spread_stats_csv_file or not self.spread_stats_csv_writer:
+            # Fallback: reinitialize if file handle is lost
+            self._initialize_spread_stats_csv_file()
+
+        if self._parquet:
+            now = time.time()
+            for spread, spread_type, ma, std, count, mn, mx in rows:
+                self._enqueue(('spread_stats_pq', (
+                    now, float(spread), spread_type, float(ma), float(std),
+                    int(count), float(mn), float(mx))))
+            return
+
+        timestamp = self._ts()
+        self._enqueue(('spread_stats', ''.join(
+            f"{timestamp},{spread:.2f},{spread_type},{ma:.2f},"
+            f"{std:.2f},{count},{mn:.2f},{mx:.2f}\r\n"
+            for spread, spread_type, ma, std, count, mn, mx in rows)))
 
     def close(self):
-        """Close CSV file handles."""
+        """Stop the writer thread and close CSV file handles."""
+        # Sentinel stops the writer loop once everything queued is written
+        self._write_queue.put(None)
+        self._writer_thread.join(timeout=5)
+
+        # Writer thread is stopped, so the Parquet buffers can be flushed
+        # and the writers closed from here without racing it
+        if self._parquet:
+            for name in self._pq_buffers:
+                try:
+                    self._flush_parquet(name)
+                    writer = self._pq_writers.get(name)
+                    if writer is not None:
+                        writer.close()
+                except Exception as e:
+                    self.logger.error(f"Error closing {name} Parquet writer: {e}")
+
+        if self.trade_csv_file:
+            try:
+                self.trade_csv_file.flush()
+                self.trade_csv_file.close()
+            except Exception as e:
+                self.logger.error(f"Error closing trade CSV file: {e}")
+
         if self.bbo_csv_file:
             try:
                 self.bbo_csv_file.flush()
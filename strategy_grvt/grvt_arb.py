@@ -3,15 +3,19 @@ import asyncio
 import signal
 import logging
 import os
+import queue
+import socket
 import sys
 import time
-import traceback
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 import aiohttp
 from decimal import Decimal
 from typing import Tuple, Dict, Any
 
+from ._stats_kernels import welford_stats
 from .data_logger import DataLogger
-from .order_book_manager import OrderBookManager
+from .order_book_manager import OrderBookManager, PRICE_SCALE
 from .websocket_manager import WebSocketManagerWrapper
 from .order_manager import OrderManager
 from .position_tracker import PositionTracker
@@ -20,12 +24,122 @@ from exchanges.grvt import GrvtClient
 from exchanges.aster import AsterClient
 from helpers.pushover_bot import PushoverBot
 
+# Optional NumPy: the spread-window statistics vectorize nicely, but the
+# bot must keep running on deployments without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Hoisted Decimal constants: parsing these from str on every WebSocket
+# callback is one of the slowest numeric paths in CPython
+_ZERO = Decimal('0')
+_MIN_LOG_FILL = Decimal('0.0001')
+
+# Branch-free side mapping for the order-update hot path
+_SIDE_TO_ORDERTYPE = {'buy': 'OPEN', 'sell': 'CLOSE'}
+
+
+class _RollingStats:
+    """Incremental Welford statistics over a bounded spread window.
+
+    Each push applies the forward Welford update and, once the window is
+    full, the reverse update for the evicted sample, so reading the
+    statistics is O(1) instead of a pass over the window. Reverse
+    updates slowly accumulate floating-point drift, so the state is
+    rebuilt from the window every 1000 pushes; min/max only fall back to
+    a scan when the evicted sample was the current extreme.
+    """
+
+    _REBUILD_EVERY = 1000
+
+    def __init__(self, values: deque):
+        self.values = values
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = 0.0
+        self.max = 0.0
+        self._pushes = 0
+
+    def push(self, x: float):
+        """Append a sample to the window and update the running state."""
+        values = self.values
+        evicted = values[0] if len(values) == values.maxlen else None
+        values.append(x)
+
+        self._pushes += 1
+        if self._pushes % self._REBUILD_EVERY == 0:
+            self.rebuild()
+            return
+
+        n = len(values)
+        if evicted is None:
+            delta = x - self.mean
+            self.mean += delta / n
+            self.m2 += (x - self.mean) * delta
+            if n == 1:
+                self.min = self.max = x
+            else:
+                if x < self.min:
+                    self.min = x
+                if x > self.max:
+                    self.max = x
+            return
 
-class Config:
-    """Simple config class to wrap configuration dictionary."""
-    def __init__(self, config_dict):
-        for key, value in config_dict.items():
-            setattr(self, key, value)
+        # Window full: add x (virtually n+1 samples), then reverse out
+        # the evicted sample to get back to n
+        delta = x - self.mean
+        self.mean += delta / (n + 1)
+        self.m2 += (x - self.mean) * delta
+        delta_old = evicted - self.mean
+        self.mean -= delta_old / n
+        self.m2 -= (evicted - self.mean) * delta_old
+        if self.m2 < 0.0:
+            # Drift from the reverse update can push m2 slightly negative
+            self.m2 = 0.0
+
+        if evicted <= self.min or evicted >= self.max:
+            self.min = min(values)
+            self.max = max(values)
+        else:
+            if x < self.min:
+                self.min = x
+            if x > self.max:
+                self.max = x
+
+    def rebuild(self):
+        """Recompute the running state from the window contents."""
+        values = self.values
+        n = len(values)
+        if n == 0:
+            self.mean = self.m2 = self.min = self.max = 0.0
+            return
+        data = (np.fromiter(values, dtype=np.float64, count=n)
+                if np is not None else list(values))
+        mean, std, mn, mx, _ = welford_stats(data)
+        self.mean = mean
+        self.m2 = std * std * n
+        self.min = mn
+        self.max = mx
+
+    def stats(self) -> Dict[str, float]:
+        """Return the statistics dict in get_spread_statistics format."""
+        n = len(self.values)
+        if n == 0:
+            return {
+                'moving_average': 0.0,
+                'rolling_std': 0.0,
+                'count': 0,
+                'min': 0.0,
+                'max': 0.0
+            }
+        return {
+            'moving_average': self.mean,
+            'rolling_std': (self.m2 / n) ** 0.5 if n >= 2 else 0.0,
+            'count': n,
+            'min': self.min,
+            'max': self.max
+        }
 
 
 class GrvtArb:
@@ -43,6 +157,7 @@ class GrvtArb:
         self.max_position = max_position
         self.stop_flag = False
         self._cleanup_done = False
+        self._shutdown_done = False
 
         # Static thresholds (used as minimum values)
         self.min_long_grvt_threshold = long_grvt_threshold
@@ -52,10 +167,24 @@ class GrvtArb:
         self.long_grvt_threshold = long_grvt_threshold
         self.short_grvt_threshold = short_grvt_threshold
 
+        # Float mirrors of the thresholds: the threshold loop works in
+        # floats, so cache the conversions instead of re-running
+        # Decimal.__float__ every interval (the minimums never change)
+        self._min_long_thr_f = float(long_grvt_threshold)
+        self._min_short_thr_f = float(short_grvt_threshold)
+        self._long_thr_f = self._min_long_thr_f
+        self._short_thr_f = self._min_short_thr_f
+
         # Spread statistics tracking - separate histories for long and short
-        self.long_spread_history = []  # Store historical long spreads (Aster bid - GRVT bid)
-        self.short_spread_history = []  # Store historical short spreads (GRVT ask - Aster ask)
         self.spread_window_size = 100  # Number of spreads to keep for MA/STD calculation
+        # deque(maxlen=...) evicts the oldest entry in O(1) on overflow,
+        # unlike list.pop(0) which shifts the whole window per insert
+        self.long_spread_history = deque(maxlen=self.spread_window_size)  # Long spreads (Aster bid - GRVT bid)
+        self.short_spread_history = deque(maxlen=self.spread_window_size)  # Short spreads (GRVT ask - Aster ask)
+        # Running Welford state alongside each window, so reading the
+        # statistics doesn't rescan the whole history
+        self._long_stats = _RollingStats(self.long_spread_history)
+        self._short_stats = _RollingStats(self.short_spread_history)
         
         # self.z_score_multiplier = 1.5  # 激进：更多交易机会
         # self.z_score_multiplier = 2.0  # 中性：平衡（当前默认）
@@ -95,6 +224,30 @@ class GrvtArb:
         # Position tracker (will be initialized after clients)
         self.position_tracker = None
 
+        # GRVT order updates are queued by the WebSocket callback and
+        # processed on a dedicated task so the socket read loop never
+        # blocks on Decimal parsing / CSV logging
+        self._grvt_update_queue = asyncio.Queue(maxsize=1000)
+        self._grvt_update_task = None
+        self._position_reconcile_task = None
+
+        # Bound str.__eq__ on the GRVT contract id; assigned in
+        # trading_loop once the id is known, before the order-update
+        # handler is registered
+        self._grvt_is_ours = None
+
+        # Last-logged timestamps per error signature, so a persistent
+        # error condition doesn't flood the log with identical stacks
+        self._error_dedup = {}
+
+        # Reused buffer for forwarding fill details to the order manager;
+        # the consumer reads the fields synchronously and must not retain
+        # a reference
+        self._grvt_forward_buf = {
+            'order_id': None, 'side': None, 'status': None, 'size': None,
+            'price': None, 'contract_id': None, 'filled_size': None,
+        }
+
         # Setup callbacks
         self._setup_callbacks()
 
@@ -138,9 +291,14 @@ class GrvtArb:
         file_handler.setFormatter(file_formatter)
         console_handler.setFormatter(console_formatter)
 
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Route records through a queue so logger calls on the event-loop
+        # thread never block on file/console writes; a background listener
+        # thread does the actual I/O
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._log_listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True)
+        self._log_listener.start()
         self.logger.propagate = False
 
     def _setup_callbacks(self):
@@ -163,18 +321,13 @@ class GrvtArb:
             short_spread: Spread for short GRVT (GRVT ask - Aster ask)
         """
         # Update long spread history - only record positive spreads
+        # (push appends to the deque and updates the running Welford state)
         if long_spread is not None and long_spread > 0:
-            self.long_spread_history.append(float(long_spread))
-            # Keep only the most recent spreads within window size
-            if len(self.long_spread_history) > self.spread_window_size:
-                self.long_spread_history.pop(0)
-        
+            self._long_stats.push(float(long_spread))
+
         # Update short spread history - only record positive spreads
         if short_spread is not None and short_spread > 0:
-            self.short_spread_history.append(float(short_spread))
-            # Keep only the most recent spreads within window size
-            if len(self.short_spread_history) > self.spread_window_size:
-                self.short_spread_history.pop(0)
+            self._short_stats.push(float(short_spread))
 
     def get_spread_statistics(self, spread_history: list, window: int = None) -> Dict[str, float]:
         """Get comprehensive spread statistics for a given spread history.
@@ -191,6 +344,13 @@ class GrvtArb:
                 - 'min': Minimum spread in window
                 - 'max': Maximum spread in window
         """
+        # Full-window reads come straight from the running Welford state
+        if window is None:
+            if spread_history is self.long_spread_history:
+                return self._long_stats.stats()
+            if spread_history is self.short_spread_history:
+                return self._short_stats.stats()
+
         if not spread_history:
             return {
                 'moving_average': 0.0,
@@ -199,13 +359,13 @@ class GrvtArb:
                 'min': 0.0,
                 'max': 0.0
             }
-        
-        # Use specified window or all available data
-        if window is None:
-            window = len(spread_history)
-        
-        recent_spreads = spread_history[-min(window, len(spread_history)):]
-        
+
+        # Use specified window or all available data (deques don't
+        # support slicing, so materialize once and trim if needed)
+        recent_spreads = list(spread_history)
+        if window is not None and window < len(recent_spreads):
+            recent_spreads = recent_spreads[-window:]
+
         if not recent_spreads:
             return {
                 'moving_average': 0.0,
@@ -215,22 +375,20 @@ class GrvtArb:
                 'max': 0.0
             }
         
-        # Calculate mean
-        mean = sum(recent_spreads) / len(recent_spreads)
-        
-        # Calculate standard deviation
-        if len(recent_spreads) >= 2:
-            variance = sum((x - mean) ** 2 for x in recent_spreads) / len(recent_spreads)
-            std = variance ** 0.5
-        else:
-            std = 0.0
-        
+        n = len(recent_spreads)
+
+        # Shared batch kernel (JIT/vectorized where the optional deps
+        # allow); ndarray input when NumPy is present, list otherwise
+        data = (np.fromiter(recent_spreads, dtype=np.float64, count=n)
+                if np is not None else recent_spreads)
+        mean, std, mn, mx, _ = welford_stats(data)
+
         return {
             'moving_average': mean,
             'rolling_std': std,
-            'count': len(recent_spreads),
-            'min': min(recent_spreads),
-            'max': max(recent_spreads)
+            'count': n,
+            'min': mn,
+            'max': mx
         }
 
     def calculate_dynamic_threshold(self, spread_history: list, min_threshold: float) -> float:
@@ -247,104 +405,117 @@ class GrvtArb:
         if len(spread_history) < self.min_samples_for_dynamic:
             # Not enough data, use minimum threshold
             return min_threshold
-        
-        stats = self.get_spread_statistics(spread_history)
-        
+
+        return self.calculate_dynamic_threshold_from_stats(
+            self.get_spread_statistics(spread_history), min_threshold)
+
+    def calculate_dynamic_threshold_from_stats(self, stats: Dict[str, float],
+                                               min_threshold: float) -> float:
+        """Calculate the Z-score threshold from an existing statistics dict.
+
+        Pure arithmetic on the mean and std, so callers that already hold
+        the statistics (the threshold loop computes them for logging)
+        don't pay a second pass over the history.
+        """
+        if stats['count'] < self.min_samples_for_dynamic:
+            return min_threshold
+
         # Calculate dynamic threshold using Z-score method
         statistical_threshold = stats['moving_average'] + self.z_score_multiplier * stats['rolling_std']
-        
+
         # Ensure threshold is always positive
         # Use the maximum of min_threshold and statistical_threshold
-        dynamic_threshold = max(min_threshold, statistical_threshold, 0.1)
-        
-        return dynamic_threshold
+        return max(min_threshold, statistical_threshold, 0.1)
 
     async def _threshold_calculation_loop(self):
         """Independent coroutine for calculating dynamic thresholds and logging spread statistics."""
         self.logger.info(f"📊 Starting dynamic threshold calculation coroutine (update interval: {self.threshold_update_interval}s)")
-        
+
+        # Loop invariants as locals: these bindings never change for the
+        # life of the coroutine (stop_flag and the thresholds stay on
+        # self because other coroutines read/write them)
+        interval = self.threshold_update_interval
+        long_hist = self.long_spread_history
+        short_hist = self.short_spread_history
+        get_stats = self.get_spread_statistics
+        log_bulk = self.data_logger.log_spread_stats_bulk
+
         while not self.stop_flag:
             try:
-                # Get long spread statistics
-                long_stats = self.get_spread_statistics(self.long_spread_history)
-                
-                # Log long spread statistics to CSV if we have data
+                # Collect both sides' statistics, then hand them to the
+                # data logger as one batched call
+                stats_rows = []
+
+                long_stats = get_stats(long_hist)
                 if long_stats['count'] > 0:
-                    recent_long_spread = self.long_spread_history[-1] if self.long_spread_history else 0.0
-                    
-                    self.data_logger.log_spread_stats_to_csv(
-                        spread=recent_long_spread,
-                        spread_type='long',
-                        moving_average=long_stats['moving_average'],
-                        rolling_std=long_stats['rolling_std'],
-                        count=long_stats['count'],
-                        min_spread=long_stats['min'],
-                        max_spread=long_stats['max']
-                    )
-                    
+                    recent_long_spread = long_hist[-1] if long_hist else 0.0
+                    stats_rows.append((
+                        recent_long_spread, 'long',
+                        long_stats['moving_average'], long_stats['rolling_std'],
+                        long_stats['count'], long_stats['min'], long_stats['max']))
                     self.logger.debug(
-                        f"📊 LONG spread stats logged: count={long_stats['count']}, "
-                        f"MA={long_stats['moving_average']:.2f}, STD={long_stats['rolling_std']:.2f}")
+                        "📊 LONG spread stats logged: count=%d, MA=%.2f, STD=%.2f",
+                        long_stats['count'], long_stats['moving_average'],
+                        long_stats['rolling_std'])
                 else:
-                    self.logger.debug(f"⏳ Waiting for LONG spread data (history size: {len(self.long_spread_history)})")
-                
-                # Get short spread statistics
-                short_stats = self.get_spread_statistics(self.short_spread_history)
-                
-                # Log short spread statistics to CSV if we have data
+                    self.logger.debug(
+                        "⏳ Waiting for LONG spread data (history size: %d)",
+                        len(long_hist))
+
+                short_stats = get_stats(short_hist)
                 if short_stats['count'] > 0:
-                    recent_short_spread = self.short_spread_history[-1] if self.short_spread_history else 0.0
-                    
-                    self.data_logger.log_spread_stats_to_csv(
-                        spread=recent_short_spread,
-                        spread_type='short',
-                        moving_average=short_stats['moving_average'],
-                        rolling_std=short_stats['rolling_std'],
-                        count=short_stats['count'],
-                        min_spread=short_stats['min'],
-                        max_spread=short_stats['max']
-                    )
-                    
+                    recent_short_spread = short_hist[-1] if short_hist else 0.0
+                    stats_rows.append((
+                        recent_short_spread, 'short',
+                        short_stats['moving_average'], short_stats['rolling_std'],
+                        short_stats['count'], short_stats['min'], short_stats['max']))
                     self.logger.debug(
-                        f"📊 SHORT spread stats logged: count={short_stats['count']}, "
-                        f"MA={short_stats['moving_average']:.2f}, STD={short_stats['rolling_std']:.2f}")
+                        "📊 SHORT spread stats logged: count=%d, MA=%.2f, STD=%.2f",
+                        short_stats['count'], short_stats['moving_average'],
+                        short_stats['rolling_std'])
                 else:
-                    self.logger.debug(f"⏳ Waiting for SHORT spread data (history size: {len(self.short_spread_history)})")
-                
-                await asyncio.sleep(self.threshold_update_interval)
-                
-                if self.stop_flag:
-                    break
-                
-                # Calculate dynamic thresholds using respective spread histories
-                new_long_threshold = self.calculate_dynamic_threshold(
-                    self.long_spread_history, float(self.min_long_grvt_threshold))
-                new_short_threshold = self.calculate_dynamic_threshold(
-                    self.short_spread_history, float(self.min_short_grvt_threshold))
-                
-                # Update thresholds if they changed significantly
-                if abs(new_long_threshold - float(self.long_grvt_threshold)) > 0.1:
+                    self.logger.debug(
+                        "⏳ Waiting for SHORT spread data (history size: %d)",
+                        len(short_hist))
+
+                if stats_rows:
+                    log_bulk(stats_rows)
+
+                # Calculate dynamic thresholds from the statistics
+                # already computed above - no second pass over the
+                # histories (cached float minimums, set once in __init__)
+                new_long_threshold = self.calculate_dynamic_threshold_from_stats(
+                    long_stats, self._min_long_thr_f)
+                new_short_threshold = self.calculate_dynamic_threshold_from_stats(
+                    short_stats, self._min_short_thr_f)
+
+                # Update thresholds if they changed significantly,
+                # comparing against the cached float mirror
+                if abs(new_long_threshold - self._long_thr_f) > 0.1:
                     old_value = self.long_grvt_threshold
                     self.long_grvt_threshold = Decimal(str(new_long_threshold))
+                    self._long_thr_f = new_long_threshold
                     self.logger.info(
                         f"📈 Dynamic LONG threshold updated: {old_value:.2f} → {new_long_threshold:.2f} "
-                        f"(samples: {len(self.long_spread_history)})")
-                
-                if abs(new_short_threshold - float(self.short_grvt_threshold)) > 0.1:
+                        f"(samples: {len(long_hist)})")
+
+                if abs(new_short_threshold - self._short_thr_f) > 0.1:
                     old_value = self.short_grvt_threshold
                     self.short_grvt_threshold = Decimal(str(new_short_threshold))
+                    self._short_thr_f = new_short_threshold
                     self.logger.info(
                         f"📉 Dynamic SHORT threshold updated: {old_value:.2f} → {new_short_threshold:.2f} "
-                        f"(samples: {len(self.short_spread_history)})")
-                
+                        f"(samples: {len(short_hist)})")
+
+                await asyncio.sleep(interval)
+
             except asyncio.CancelledError:
                 self.logger.info("🔌 Threshold calculation coroutine cancelled")
                 break
-            except Exception as e:
+            except Exception:
                 if not self.stop_flag:
-                    self.logger.error(f"⚠️ Error in threshold calculation loop: {e}")
-                    self.logger.error(traceback.format_exc())
-                await asyncio.sleep(self.threshold_update_interval)
+                    self.logger.exception("⚠️ Error in threshold calculation loop")
+                await asyncio.sleep(interval)
 
     def start_threshold_calculation(self):
         """Start the threshold calculation coroutine."""
@@ -352,26 +523,46 @@ class GrvtArb:
             self.threshold_calculation_task = asyncio.create_task(self._threshold_calculation_loop())
             self.logger.info("✅ Threshold calculation coroutine started")
 
+    def _log_exception_ratelimited(self, message: str, exc: Exception):
+        """Log an exception with traceback at most once per signature per 5s.
+
+        Repeats of the same error within the window are dropped entirely,
+        which keeps error storms (e.g. WS reconnect flapping) from
+        dominating the hot path with stack formatting.
+        """
+        key = (type(exc).__name__, str(exc))
+        now = time.monotonic()
+        if now - self._error_dedup.get(key, 0.0) < 5.0:
+            return
+        if len(self._error_dedup) > 256:
+            self._error_dedup.clear()
+        self._error_dedup[key] = now
+        self.logger.exception(message)
+
     def _handle_aster_order_filled(self, order_data: dict):
         """Handle Aster order fill."""
         try:
-            side = order_data.get("side", "") 
+            side = order_data.get("side", "")
             filled_amount = order_data.get("filled_base_amount", 0)
             avg_price = order_data.get("avg_filled_price", 0)
-            
+
+            # Build the fill Decimal once for either branch
+            filled_delta = Decimal(filled_amount)
+            pt = self.position_tracker
             if side == "SHORT":
                 order_type = "OPEN"
-                if self.position_tracker:
-                    self.position_tracker.update_aster_position(-Decimal(filled_amount))
+                if pt:
+                    pt.update_aster_position(-filled_delta)
             else:
                 order_type = "CLOSE"
-                if self.position_tracker:
-                    self.position_tracker.update_aster_position(Decimal(filled_amount))
+                if pt:
+                    pt.update_aster_position(filled_delta)
 
             order_id = order_data.get("order_id", "")
+            # %s-style so formatting is deferred until a handler emits
             self.logger.info(
-                f"[{order_id}] [{order_type}] [Aster] [FILLED]: "
-                f"{filled_amount} @ {avg_price}")
+                "[%s] [%s] [Aster] [FILLED]: %s @ %s",
+                order_id, order_type, filled_amount, avg_price)
 
             # Log trade to CSV
             self.data_logger.log_trade_to_csv(
@@ -381,33 +572,54 @@ class GrvtArb:
                 quantity=str(filled_amount)
             )
 
-            # Mark execution as complete
+            # Mark execution as complete and wake any waiting executor
             self.order_manager.aster_order_filled = True
             self.order_manager.order_execution_complete = True
+            self.order_manager.execution_complete_event.set()
 
         except Exception as e:
-            self.logger.error(f"Error handling Aster order result: {e}")
+            self._log_exception_ratelimited("Error handling Aster order result", e)
 
     def _handle_grvt_order_update(self, order: dict):
-        """Handle GRVT order update from WebSocket."""
+        """Enqueue a GRVT order update from the WebSocket callback.
+
+        Kept deliberately tiny so the socket read loop isn't blocked;
+        the real work happens in _process_grvt_updates. Messages for
+        other contracts are dropped here, before any queue churn.
+        """
+        # str.__eq__ returns NotImplemented (truthy) for non-str ids,
+        # so only an exact True counts as a match
+        if self._grvt_is_ours(order.get('contract_id')) is not True:
+            return
         try:
-            if order.get('contract_id') != self.grvt_contract_id:
-                return
+            self._grvt_update_queue.put_nowait(order)
+        except asyncio.QueueFull:
+            self.logger.warning("⚠️ GRVT update queue full - dropping order update")
 
+    async def _process_grvt_updates(self):
+        """Drain the GRVT order update queue on a dedicated task."""
+        while not self.stop_flag:
+            order = await self._grvt_update_queue.get()
+            self._process_grvt_order_update(order)
+
+    def _process_grvt_order_update(self, order: dict):
+        """Handle GRVT order update from WebSocket."""
+        try:
+            # Contract filtering already happened at enqueue time
             order_id = order.get('order_id')
             status = order.get('status')
             side = order.get('side', '').lower()
-            filled_size = Decimal(order.get('filled_size', '0'))
-            size = Decimal(order.get('size', '0'))
+            # Skip Decimal construction for the common '0' case
+            raw_filled = order.get('filled_size') or '0'
+            filled_size = _ZERO if raw_filled == '0' else Decimal(raw_filled)
+            raw_size = order.get('size') or '0'
+            size = _ZERO if raw_size == '0' else Decimal(raw_size)
             price = order.get('price', '0')
 
-            if side == 'buy':
-                order_type = "OPEN"
-            else:
-                order_type = "CLOSE"
+            order_type = _SIDE_TO_ORDERTYPE.get(side, 'CLOSE')
 
             # Handle partially filled or fully filled orders that were canceled
-            if status == 'CANCELED' and filled_size > 0:
+            if status == 'CANCELED' and filled_size > _ZERO:
                 status = 'FILLED'
 
             # Update order status
@@ -415,18 +627,17 @@ class GrvtArb:
                 self.order_manager.update_grvt_order_status(status)
 
             # Handle filled orders
-            if status == 'FILLED' and filled_size > 0:
-                if side == 'buy':
-                    if self.position_tracker:
-                        self.position_tracker.update_grvt_position(filled_size)
-                else:
-                    if self.position_tracker:
-                        self.position_tracker.update_grvt_position(-filled_size)
+            if status == 'FILLED' and filled_size > _ZERO:
+                pt = self.position_tracker
+                if pt:
+                    pt.update_grvt_position(
+                        filled_size if side == 'buy' else -filled_size)
 
                 self.logger.info(
-                    f"[{order_id}] [{order_type}] [GRVT] [{status}]: {filled_size} @ {price}")
+                    "[%s] [%s] [GRVT] [%s]: %s @ %s",
+                    order_id, order_type, status, filled_size, price)
 
-                if filled_size > Decimal('0.0001'):
+                if filled_size > _MIN_LOG_FILL:
                     # Log GRVT trade to CSV
                     self.data_logger.log_trade_to_csv(
                         exchange='GRVT',
@@ -435,35 +646,40 @@ class GrvtArb:
                         quantity=str(filled_size)
                     )
 
-                # Trigger Aster order placement
-                self.order_manager.handle_grvt_order_update({
-                    'order_id': order_id,
-                    'side': side,
-                    'status': status,
-                    'size': size,
-                    'price': price,
-                    'contract_id': self.grvt_contract_id,
-                    'filled_size': filled_size
-                })
+                # Trigger Aster order placement (mutate the reused buffer
+                # in place instead of allocating a dict per update)
+                buf = self._grvt_forward_buf
+                buf['order_id'] = order_id
+                buf['side'] = side
+                buf['status'] = status
+                buf['size'] = size
+                buf['price'] = price
+                buf['contract_id'] = self.grvt_contract_id
+                buf['filled_size'] = filled_size
+                self.order_manager.handle_grvt_order_update(buf)
             elif status != 'FILLED':
                 if status == 'OPEN':
-                    self.logger.info(f"[{order_id}] [{order_type}] [GRVT] [{status}]: {size} @ {price}")
+                    self.logger.info(
+                        "[%s] [%s] [GRVT] [%s]: %s @ %s",
+                        order_id, order_type, status, size, price)
                 else:
                     self.logger.info(
-                        f"[{order_id}] [{order_type}] [GRVT] [{status}]: {filled_size} @ {price}")
+                        "[%s] [%s] [GRVT] [%s]: %s @ %s",
+                        order_id, order_type, status, filled_size, price)
 
         except Exception as e:
-            self.logger.error(f"Error handling GRVT order update: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self._log_exception_ratelimited("Error handling GRVT order update", e)
 
 
 
     def shutdown(self, signum=None, frame=None):
         """Graceful shutdown handler."""
-        # Prevent multiple shutdown calls
-        if self.stop_flag:
+        # Prevent multiple shutdown calls (stop_flag alone can't guard
+        # this anymore - the signal path sets it without cleaning up)
+        if self._shutdown_done:
             return
 
+        self._shutdown_done = True
         self.stop_flag = True
 
         if signum is not None:
@@ -478,7 +694,17 @@ class GrvtArb:
         except Exception as e:
             self.logger.error(f"Error closing data logger: {e}")
 
-        # Close logging handlers
+        # Stop the log listener (flushes queued records), then close the
+        # real handlers it was feeding
+        try:
+            if self._log_listener:
+                self._log_listener.stop()
+                for handler in self._log_listener.handlers:
+                    handler.close()
+                self._log_listener = None
+        except Exception:
+            pass
+
         for handler in self.logger.handlers[:]:
             try:
                 handler.close()
@@ -504,6 +730,24 @@ class GrvtArb:
             except Exception as e:
                 self.logger.error(f"Error cancelling threshold calculation task: {e}")
 
+        # Cancel GRVT update processing and position reconcile tasks
+        for task in (self._grvt_update_task, self._position_reconcile_task):
+            if task and not task.done():
+                try:
+                    task.cancel()
+                    await asyncio.wait_for(task, timeout=2.0)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    pass
+                except Exception as e:
+                    self.logger.error(f"Error cancelling background task: {e}")
+
+        # Close Pushover HTTP session
+        try:
+            if self.pushover_bot:
+                await self.pushover_bot.close()
+        except Exception as e:
+            self.logger.error(f"Error closing Pushover session: {e}")
+
         # Shutdown WebSocket manager
         try:
             if self.ws_manager:
@@ -538,33 +782,76 @@ class GrvtArb:
         except Exception as e:
             self.logger.error(f"Error disconnecting Aster client: {e}")
 
+    def _request_stop(self):
+        """Stop callback for signals: runs on the event loop between steps.
+
+        Just flips the flag - the loops observe it at their next await
+        point and run() performs the actual cleanup, so no async resource
+        is ever touched from inside a signal frame.
+        """
+        if not self.stop_flag:
+            self.logger.info("🛑 Stop requested...")
+        self.stop_flag = True
+
     def setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown."""
-        signal.signal(signal.SIGINT, self.shutdown)
-        signal.signal(signal.SIGTERM, self.shutdown)
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, self._request_stop)
+            loop.add_signal_handler(signal.SIGTERM, self._request_stop)
+        except NotImplementedError:
+            # add_signal_handler is unavailable on some platforms
+            signal.signal(signal.SIGINT, self.shutdown)
+            signal.signal(signal.SIGTERM, self.shutdown)
 
     def initialize_grvt_client(self):
         """Initialize the GRVT client."""
         if self.grvt_client is None:
-            config = Config({
+            self.grvt_client = GrvtClient({
                 'ticker': self.ticker,
                 'quantity': self.order_quantity
             })
-            self.grvt_client = GrvtClient(config.__dict__)
             self.logger.info("✅ GRVT client initialized successfully")
         return self.grvt_client
 
     def initialize_aster_client(self):
         """Initialize the Aster client."""
         if self.aster_client is None:
-            config = Config({
+            self.aster_client = AsterClient({
                 'ticker': self.ticker,
                 'quantity': self.order_quantity
             })
-            self.aster_client = AsterClient(config.__dict__)
             self.logger.info("✅ Aster client initialized successfully")
         return self.aster_client
 
+    def _enable_tcp_nodelay(self):
+        """Best-effort TCP_NODELAY on the exchange sockets.
+
+        asyncio disables Nagle on its own TCP transports, but the Aster
+        WebSocket comes from the websockets library and the GRVT SDK
+        manages its own connections. The Aster hedge order fires right
+        after a GRVT fill notification, so it must not sit behind
+        Nagle's coalescing delay.
+        """
+        transports = []
+        ws_manager = getattr(self.aster_client, 'ws_manager', None)
+        websocket = getattr(ws_manager, 'websocket', None)
+        if websocket is not None:
+            transports.append(getattr(websocket, 'transport', None))
+        grvt_ws = getattr(self.grvt_client, 'ws', None)
+        if grvt_ws is not None:
+            transports.append(getattr(grvt_ws, 'transport', None))
+
+        for transport in transports:
+            if transport is None:
+                continue
+            try:
+                sock = transport.get_extra_info('socket')
+                if sock is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (OSError, AttributeError):
+                pass
+
     async def get_grvt_contract_info(self) -> Tuple[str, Decimal]:
         """Get GRVT contract ID and tick size."""
         if not self.grvt_client:
@@ -601,22 +888,28 @@ class GrvtArb:
             self.initialize_aster_client()
 
             # Get contract info
-            self.grvt_contract_id, self.grvt_tick_size = await self.get_grvt_contract_info()
-            self.aster_contract_id, self.aster_tick_size = await self.get_aster_contract_info()
+            # The two contract-info fetches hit independent venues - run
+            # them concurrently so startup pays the slower RTT, not the sum
+            ((self.grvt_contract_id, self.grvt_tick_size),
+             (self.aster_contract_id, self.aster_tick_size)) = await asyncio.gather(
+                self.get_grvt_contract_info(), self.get_aster_contract_info())
+
+            # Specialized contract-id predicate for the WS callback:
+            # str.__eq__ bound to the known id is a single C slot call
+            self._grvt_is_ours = self.grvt_contract_id.__eq__
 
             self.logger.info(
                 f"Contract info loaded - GRVT: {self.grvt_contract_id}, "
                 f"Aster: {self.aster_contract_id}")
 
-        except Exception as e:
-            self.logger.error(f"❌ Failed to initialize: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            self.logger.exception("❌ Failed to initialize")
             return
 
         # Initialize position tracker
         if not self.grvt_client or not self.aster_client:
             raise Exception("Clients not properly initialized")
-            
+
         self.position_tracker = PositionTracker(
             self.ticker,
             self.grvt_client,
@@ -625,9 +918,6 @@ class GrvtArb:
         )
 
         # Configure modules
-        if not self.grvt_client or not self.aster_client:
-            raise Exception("Clients not properly initialized")
-            
         self.order_manager.set_grvt_config(
             self.grvt_client, self.grvt_contract_id, self.grvt_tick_size)
         self.order_manager.set_aster_config(
@@ -639,21 +929,24 @@ class GrvtArb:
 
         # Connect to GRVT and setup WebSocket for order book
         try:
-            # Connect GRVT client
-            await self.grvt_client.connect()
-            self.logger.info("✅ GRVT client connected")
-            
+            # Connect both clients concurrently; the Aster order client
+            # has no dependency on the GRVT setup that follows
+            await asyncio.gather(
+                self.grvt_client.connect(), self.aster_client.connect())
+            self.logger.info("✅ GRVT and Aster clients connected")
+
+
             # Setup GRVT order update handler
             self.grvt_client.setup_order_update_handler(self._handle_grvt_order_update)
+            self._grvt_update_task = asyncio.create_task(self._process_grvt_updates())
             self.logger.info("✅ GRVT order update handler setup")
             
             # Setup GRVT WebSocket for order book updates
             self.logger.info("📡 Setting up GRVT WebSocket for order book...")
             await self.ws_manager.setup_grvt_websocket()
 
-        except Exception as e:
-            self.logger.error(f"❌ Failed to connect to GRVT: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            self.logger.exception("❌ Failed to connect to GRVT")
             return
 
         # Setup Aster websocket
@@ -661,20 +954,23 @@ class GrvtArb:
             await self.ws_manager.setup_aster_websocket()
             self.logger.info("✅ Aster WebSocket task started")
 
-            # Wait for both order books to be ready
+            # Wait for both order books to be ready: park on the
+            # readiness events instead of polling, so the loop wakes
+            # exactly when the second book arrives
             self.logger.info("⏳ Waiting for order book data...")
             timeout = 15
-            start_time = time.time()
-            while (not self.order_book_manager.aster_order_book_ready or 
-                   not self.order_book_manager.grvt_order_book_ready) and not self.stop_flag:
-                if time.time() - start_time > timeout:
-                    self.logger.warning(
-                        f"⚠️ Timeout waiting for order book data after {timeout}s")
-                    self.logger.warning(
-                        f"Status - GRVT ready: {self.order_book_manager.grvt_order_book_ready}, "
-                        f"Aster ready: {self.order_book_manager.aster_order_book_ready}")
-                    break
-                await asyncio.sleep(0.5)
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        self.order_book_manager.grvt_ready_event.wait(),
+                        self.order_book_manager.aster_ready_event.wait()),
+                    timeout=timeout)
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    f"⚠️ Timeout waiting for order book data after {timeout}s")
+                self.logger.warning(
+                    f"Status - GRVT ready: {self.order_book_manager.grvt_order_book_ready}, "
+                    f"Aster ready: {self.order_book_manager.aster_order_book_ready}")
 
             if self.order_book_manager.grvt_order_book_ready and self.order_book_manager.aster_order_book_ready:
                 self.logger.info("✅ Both order books ready")
@@ -685,19 +981,24 @@ class GrvtArb:
             self.logger.error(f"❌ Failed to setup Aster websocket: {e}")
             return
 
-        # Connect Aster client for orders
-        await self.aster_client.connect()
-        self.logger.info("✅ Aster client connected")
-
+        # Aster order client already connected above alongside GRVT
         await asyncio.sleep(3)
 
+        # Disable Nagle on whatever sockets the clients expose by now
+        self._enable_tcp_nodelay()
+
         # Get initial positions
         try:
             if not self.position_tracker:
                 raise Exception("Position tracker not initialized")
                 
-            self.position_tracker.grvt_position = await self.position_tracker.get_grvt_position()
-            self.position_tracker.aster_position = await self.position_tracker.get_aster_position()
+            # Independent REST endpoints - fetch both concurrently
+            grvt_pos, aster_pos = await asyncio.gather(
+                self.position_tracker.get_grvt_position(),
+                self.position_tracker.get_aster_position()
+            )
+            self.position_tracker.grvt_position = grvt_pos
+            self.position_tracker.aster_position = aster_pos
             self.last_position_update = time.time()  # Initialize cache timestamp
             self.logger.info(
                 f"Initial positions - GRVT: {self.position_tracker.grvt_position}, "
@@ -706,6 +1007,10 @@ class GrvtArb:
             self.logger.error(f"❌ Failed to get initial positions: {e}")
             return
 
+        # Reconcile cached positions against REST off the hot path
+        self._position_reconcile_task = asyncio.create_task(
+            self._reconcile_positions_loop())
+
         # Start dynamic threshold calculation coroutine
         self.start_threshold_calculation()
         self.logger.info(
@@ -713,14 +1018,45 @@ class GrvtArb:
             f"min_samples={self.min_samples_for_dynamic}, "
             f"min_long={self.min_long_grvt_threshold}, min_short={self.min_short_grvt_threshold}")
 
+        # Hoist loop invariants: the thresholds stay on self because the
+        # threshold coroutine rewrites them, but these never change and
+        # the bindings save attribute-chain lookups every iteration
+        max_pos = self.max_position
+        neg_max = -max_pos
+        obm = self.order_book_manager
+        get_grvt_bbo = obm.get_grvt_bbo
+        get_aster_bbo = obm.get_aster_bbo
+        to_price = obm.to_price
+        tick_f = 1.0 / PRICE_SCALE
+        dl_log = self.data_logger.log_bbo_to_csv
+        update_stats = self.update_spread_statistics
+        get_pos = self.position_tracker.get_current_grvt_position
+
+        # Signal memo: if neither the BBO nor the (dynamic) thresholds
+        # changed since last tick, the flags can't change either, so skip
+        # the subtractions entirely. Thresholds are mirrored into integer
+        # 1e-8 units when the threshold coroutine changes them, so the
+        # per-tick comparisons are pure int arithmetic
+        last_sig_key = None
+        last_flags = (False, False)
+        last_thr_pair = None
+        long_thr_t = short_thr_t = 0
+
+        # BBO log gate: only call the data logger on a signal, a quote
+        # change, or a 1s heartbeat, so quiet markets don't pay the call
+        # and argument packing every tick
+        log_loop = asyncio.get_running_loop()
+        last_log_bbo = None
+        last_log_ts = 0.0
+
         # Main trading loop
         while not self.stop_flag:
             try:
                 # await asyncio.sleep(1)
-                
+
                 # Get BBO from order book manager (WebSocket data)
-                grvt_best_bid, grvt_best_ask = self.order_book_manager.get_grvt_bbo()
-                aster_best_bid, aster_best_ask = self.order_book_manager.get_aster_bbo()
+                grvt_best_bid, grvt_best_ask = get_grvt_bbo()
+                aster_best_bid, aster_best_ask = get_aster_bbo()
 
                 # Check if we have valid order book data
                 if not grvt_best_bid or not grvt_best_ask:
@@ -733,76 +1069,131 @@ class GrvtArb:
                     await asyncio.sleep(0.5)
                     continue
 
-                long_grvt = False
-                short_grvt = False
-                
                 # Update spread statistics for coroutine to use (no logging here)
+                # Prices are ints in 1e-8 units, so spreads drop straight
+                # out as ints and scale to floats for the rolling stats
                 if aster_best_bid and grvt_best_bid:
-                    long_spread = aster_best_bid - grvt_best_bid
-                    self.update_spread_statistics(long_spread=Decimal(str(long_spread)))
-                    
+                    update_stats(long_spread=(aster_best_bid - grvt_best_bid) * tick_f)
+
                 if grvt_best_ask and aster_best_ask:
-                    short_spread = grvt_best_ask - aster_best_ask
-                    self.update_spread_statistics(short_spread=Decimal(str(short_spread)))
-                                
-                # Check for trading signals (log to main log only when signal triggered)
-                if (aster_best_bid and grvt_best_bid and
-                        aster_best_bid - grvt_best_bid > self.long_grvt_threshold):
-                    long_grvt = True
-                    self.logger.debug(
-                        f"🟢 LONG GRVT Signal | "
-                        f"Aster Bid: {aster_best_bid:.6f} | GRVT Bid: {grvt_best_bid:.6f} | "
-                        f"Threshold: {self.long_grvt_threshold}")
-                    
-                elif (grvt_best_ask and aster_best_ask and
-                      grvt_best_ask - aster_best_ask > self.short_grvt_threshold):
-                    short_grvt = True
-                    self.logger.debug(
-                        f"🔴 SHORT GRVT Signal | "
-                        f"GRVT Ask: {grvt_best_ask:.6f} | Aster Ask: {aster_best_ask:.6f} | "
-                        f"Threshold: {self.short_grvt_threshold}")
-
-                # Log BBO data (using WebSocket order book data)
-                self.data_logger.log_bbo_to_csv(
-                    maker_bid=grvt_best_bid,
-                    maker_ask=grvt_best_ask,
-                    taker_bid=aster_best_bid,
-                    taker_ask=aster_best_ask,
-                    long_maker=long_grvt,
-                    short_maker=short_grvt,
-                    long_maker_threshold=self.long_grvt_threshold,
-                    short_maker_threshold=self.short_grvt_threshold
-                )
+                    update_stats(short_spread=(grvt_best_ask - aster_best_ask) * tick_f)
+
+                # Refresh the integer threshold mirrors only when the
+                # threshold coroutine actually moved them
+                thr_pair = (self._long_thr_f, self._short_thr_f)
+                if thr_pair != last_thr_pair:
+                    long_thr_t = int(round(thr_pair[0] * PRICE_SCALE))
+                    short_thr_t = int(round(thr_pair[1] * PRICE_SCALE))
+                    last_thr_pair = thr_pair
+                    last_sig_key = None
+
+                # Check for trading signals, reusing the previous result
+                # when BBO and thresholds are unchanged since last tick
+                sig_key = (grvt_best_bid, grvt_best_ask,
+                           aster_best_bid, aster_best_ask)
+                if sig_key == last_sig_key:
+                    long_grvt, short_grvt = last_flags
+                else:
+                    # Evaluate both sides unconditionally (the earlier
+                    # elif hid a short-side dislocation whenever the long
+                    # side fired); all four prices are non-None here
+                    # thanks to the readiness continues above
+                    long_grvt = aster_best_bid - grvt_best_bid > long_thr_t
+                    short_grvt = grvt_best_ask - aster_best_ask > short_thr_t
+
+                    # %s-style args defer formatting until DEBUG is
+                    # actually emitted, so INFO runs skip it entirely
+                    if long_grvt:
+                        self.logger.debug(
+                            "🟢 LONG GRVT Signal | Aster Bid: %.6f | "
+                            "GRVT Bid: %.6f | Threshold: %s",
+                            aster_best_bid * tick_f, grvt_best_bid * tick_f,
+                            self.long_grvt_threshold)
+                    if short_grvt:
+                        self.logger.debug(
+                            "🔴 SHORT GRVT Signal | GRVT Ask: %.6f | "
+                            "Aster Ask: %.6f | Threshold: %s",
+                            grvt_best_ask * tick_f, aster_best_ask * tick_f,
+                            self.short_grvt_threshold)
+
+                    last_sig_key = sig_key
+                    last_flags = (long_grvt, short_grvt)
+
+                # Log BBO data (using WebSocket order book data); the
+                # data logger wants Decimals, so convert at the boundary
+                now = log_loop.time()
+                bbo = sig_key
+                if (long_grvt or short_grvt or bbo != last_log_bbo
+                        or now - last_log_ts > 1.0):
+                    dl_log(
+                        maker_bid=to_price(grvt_best_bid),
+                        maker_ask=to_price(grvt_best_ask),
+                        taker_bid=to_price(aster_best_bid),
+                        taker_ask=to_price(aster_best_ask),
+                        long_maker=long_grvt,
+                        short_maker=short_grvt,
+                        long_maker_threshold=self.long_grvt_threshold,
+                        short_maker_threshold=self.short_grvt_threshold
+                    )
+                    last_log_bbo = bbo
+                    last_log_ts = now
 
-                if long_grvt or short_grvt:
-                    # Update positions at the beginning of each loop iteration
-                    if not await self._update_positions():
-                        continue
-                    
-                    if self.stop_flag:
-                        break
+                # Positions are kept current by the fill callbacks, so a
+                # live signal fires on the cached counters instead of
+                # paying REST round-trips; the background reconcile task
+                # corrects any drift every 30s
 
                 # Execute trades
-                if self.position_tracker:
-                    if (self.position_tracker.get_current_grvt_position() < self.max_position and
-                            long_grvt):
-                        await self._execute_long_trade()
-                        await asyncio.sleep(2)
-                    elif (self.position_tracker.get_current_grvt_position() > -1 * self.max_position and
-                          short_grvt):
-                        await self._execute_short_trade()
-                        await asyncio.sleep(2)
-                    else:
-                        await asyncio.sleep(0.05)
+                if long_grvt and get_pos() < max_pos:
+                    await self._execute_long_trade()
+                    await asyncio.sleep(2)
+                elif short_grvt and get_pos() > neg_max:
+                    await self._execute_short_trade()
+                    await asyncio.sleep(2)
                 else:
-                    await asyncio.sleep(0.05)
+                    # Park until the top of book moves (1s safety timeout)
+                    # instead of re-evaluating an unchanged market at 20Hz.
+                    # Wait first, then clear: an update that landed during
+                    # this iteration wakes us immediately and is re-read
+                    # on the next pass.
+                    try:
+                        await asyncio.wait_for(
+                            obm.bbo_update_event.wait(), timeout=1.0)
+                    except asyncio.TimeoutError:
+                        pass
+                    obm.bbo_update_event.clear()
 
             except Exception as e:
                 if not self.stop_flag:
-                    self.logger.error(f"⚠️ Error in main trading loop: {e}")
-                    self.logger.error(f"Traceback: {traceback.format_exc()}")
+                    self._log_exception_ratelimited("⚠️ Error in main trading loop", e)
                     await asyncio.sleep(1)
 
+    async def _reconcile_positions_loop(self):
+        """Periodically reconcile cached positions against the REST APIs.
+
+        The fill callbacks keep the cached counters authoritative between
+        runs; this loop only corrects drift (missed fills, manual trades)
+        without adding latency to the trade path.
+        """
+        while not self.stop_flag:
+            try:
+                await asyncio.sleep(30)
+                if self.stop_flag:
+                    break
+                pt = self.position_tracker
+                cached = (pt.grvt_position, pt.aster_position)
+                if await self._update_positions(force=True):
+                    current = (pt.grvt_position, pt.aster_position)
+                    if current != cached:
+                        self.logger.warning(
+                            f"⚠️ Position drift corrected - cached: {cached}, "
+                            f"actual: {current}")
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                if not self.stop_flag:
+                    self.logger.exception("⚠️ Error reconciling positions")
+
     async def _update_positions(self, force: bool = False) -> bool:
         """Update positions from both exchanges.
         
@@ -817,26 +1208,32 @@ class GrvtArb:
         # Check if cache is still valid (unless forced)
         if not force and (current_time - self.last_position_update) < self.position_cache_interval:
             self.logger.debug(
-                f"📊 Using cached positions (age: {current_time - self.last_position_update:.1f}s)")
+                "📊 Using cached positions (age: %.1fs)",
+                current_time - self.last_position_update)
             return True
         
         try:
-            self.position_tracker.grvt_position = await asyncio.wait_for(
-                self.position_tracker.get_grvt_position(),
+            # One timeout scope around both fetches: the endpoints are
+            # independent, so run them concurrently instead of paying two
+            # sequential round-trips (and two wait_for wrappers)
+            pt = self.position_tracker
+            grvt_pos, aster_pos = await asyncio.wait_for(
+                asyncio.gather(
+                    pt.get_grvt_position(),
+                    pt.get_aster_position()
+                ),
                 timeout=3.0
             )
             if self.stop_flag:
                 return False
-            self.position_tracker.aster_position = await asyncio.wait_for(
-                self.position_tracker.get_aster_position(),
-                timeout=3.0
-            )
-            
+            pt.grvt_position = grvt_pos
+            pt.aster_position = aster_pos
+
             # Update cache timestamp
             self.last_position_update = current_time
             self.logger.debug(
-                f"📊 Positions updated from API - GRVT: {self.position_tracker.grvt_position}, "
-                f"Aster: {self.position_tracker.aster_position}")
+                "📊 Positions updated from API - GRVT: %s, Aster: %s",
+                grvt_pos, aster_pos)
             return True
         except asyncio.TimeoutError:
             if self.stop_flag:
@@ -849,126 +1246,99 @@ class GrvtArb:
             self.logger.error(f"⚠️ Error getting positions: {e}")
             return False
 
-    async def _execute_long_trade(self):
-        """Execute a long trade (buy on GRVT, sell on Aster)."""
-        if self.stop_flag or not self.position_tracker:
+    async def _execute_trade(self, side: str):
+        """Execute an arbitrage trade for the given GRVT side.
+
+        'buy' opens long on GRVT (hedged with an Aster sell),
+        'sell' opens short on GRVT (hedged with an Aster buy).
+        """
+        pt = self.position_tracker
+        if self.stop_flag or not pt:
             return
 
         self.logger.info(
-            f"GRVT position: {self.position_tracker.grvt_position} | "
-            f"Aster position: {self.position_tracker.aster_position}")
+            f"GRVT position: {pt.grvt_position} | "
+            f"Aster position: {pt.aster_position}")
 
-        if abs(self.position_tracker.get_net_position()) > self.order_quantity * 2:
-            net_position = self.position_tracker.get_net_position()
+        net_position = pt.get_net_position()
+        if abs(net_position) > self.order_quantity * 2:
             self.logger.error(f"❌ Position diff is too large: {net_position}")
-            
-            # Send emergency Pushover alert for long trade
-            alert_title = f"🚨 {self.ticker} Position Imbalance (LONG)"
+
+            # Send emergency Pushover alert
+            direction = 'LONG' if side == 'buy' else 'SHORT'
+            alert_title = f"🚨 {self.ticker} Position Imbalance ({direction})"
             alert_message = (
                 f"Position difference exceeded threshold!\n\n"
                 f"Net Position: {net_position}\n"
-                f"GRVT: {self.position_tracker.grvt_position}\n"
-                f"Aster: {self.position_tracker.aster_position}\n"
+                f"GRVT: {pt.grvt_position}\n"
+                f"Aster: {pt.aster_position}\n"
                 f"Threshold: {self.order_quantity * 2}\n\n"
                 f"Bot is shutting down."
             )
-            await self.pushover_bot.send_alert(alert_title, alert_message, priority=2)
-            
+            # Fire the alert as a task so it overlaps the shutdown
+            # bookkeeping, but drain it (bounded) before _async_cleanup
+            # closes the shared HTTP session out from under the POST
+            alert_task = asyncio.create_task(
+                self.pushover_bot.send_alert(alert_title, alert_message, priority=2))
+            self.stop_flag = True
+            try:
+                await asyncio.wait_for(alert_task, timeout=5.0)
+            except Exception:
+                pass
+            await self._async_cleanup()
+
             sys.exit(1)
 
         self.order_manager.order_execution_complete = False
         self.order_manager.waiting_for_aster_fill = False
+        self.order_manager.execution_complete_event.clear()
+        self.order_manager.aster_fill_ready_event.clear()
 
         try:
-            side = 'buy'
             order_filled = await self.order_manager.place_grvt_post_only_order(
                 side, self.order_quantity, self.stop_flag)
             if not order_filled or self.stop_flag:
                 return
-        except Exception as e:
+        except Exception:
             if self.stop_flag:
                 return
-            self.logger.error(f"⚠️ Error placing GRVT order: {e}")
-            self.logger.error(f"⚠️ Full traceback: {traceback.format_exc()}")
+            self.logger.exception("⚠️ Error placing GRVT order")
+            return
+
+        om = self.order_manager
+        # Wait on the callback events instead of polling every 10ms
+        waiters = [
+            asyncio.create_task(om.aster_fill_ready_event.wait()),
+            asyncio.create_task(om.execution_complete_event.wait()),
+        ]
+        done, pending = await asyncio.wait(
+            waiters, timeout=180, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        if not done:
+            self.logger.error("❌ Timeout waiting for trade completion")
+            return
+        if self.stop_flag:
             return
 
-        start_time = time.time()
-        while not self.order_manager.order_execution_complete and not self.stop_flag:
-            if self.order_manager.waiting_for_aster_fill:
-                await self.order_manager.place_aster_market_order(
-                    self.order_manager.current_aster_side,
-                    self.order_manager.current_aster_quantity,
-                    self.order_manager.current_aster_price,
+        if om.waiting_for_aster_fill and not om.order_execution_complete:
+            if (om.current_aster_side and
+                    om.current_aster_quantity and
+                    om.current_aster_price):
+                await om.place_aster_market_order(
+                    om.current_aster_side,
+                    om.current_aster_quantity,
+                    om.current_aster_price,
                     self.stop_flag
                 )
-                break
 
-            await asyncio.sleep(0.01)
-            if time.time() - start_time > 180:
-                self.logger.error("❌ Timeout waiting for trade completion")
-                break
+    async def _execute_long_trade(self):
+        """Execute a long trade (buy on GRVT, sell on Aster)."""
+        return await self._execute_trade('buy')
 
     async def _execute_short_trade(self):
         """Execute a short trade (sell on GRVT, buy on Aster)."""
-        if self.stop_flag or not self.position_tracker:
-            return
-
-        self.logger.info(
-            f"GRVT position: {self.position_tracker.grvt_position} | "
-            f"Aster position: {self.position_tracker.aster_position}")
-
-        if abs(self.position_tracker.get_net_position()) > self.order_quantity * 2:
-            net_position = self.position_tracker.get_net_position()
-            self.logger.error(f"❌ Position diff is too large: {net_position}")
-            
-            # Send emergency Pushover alert for short trade
-            alert_title = f"🚨 {self.ticker} Position Imbalance (SHORT)"
-            alert_message = (
-                f"Position difference exceeded threshold!\n\n"
-                f"Net Position: {net_position}\n"
-                f"GRVT: {self.position_tracker.grvt_position}\n"
-                f"Aster: {self.position_tracker.aster_position}\n"
-                f"Threshold: {self.order_quantity * 2}\n\n"
-                f"Bot is shutting down."
-            )
-            await self.pushover_bot.send_alert(alert_title, alert_message, priority=2)
-            
-            sys.exit(1)
-
-        self.order_manager.order_execution_complete = False
-        self.order_manager.waiting_for_aster_fill = False
-
-        try:
-            side = 'sell'
-            order_filled = await self.order_manager.place_grvt_post_only_order(
-                side, self.order_quantity, self.stop_flag)
-            if not order_filled or self.stop_flag:
-                return
-        except Exception as e:
-            if self.stop_flag:
-                return
-            self.logger.error(f"⚠️ Error placing GRVT order: {e}")
-            self.logger.error(f"⚠️ Full traceback: {traceback.format_exc()}")
-            return
-
-        start_time = time.time()
-        while not self.order_manager.order_execution_complete and not self.stop_flag:
-            if self.order_manager.waiting_for_aster_fill:
-                if (self.order_manager.current_aster_side and 
-                    self.order_manager.current_aster_quantity and 
-                    self.order_manager.current_aster_price):
-                    await self.order_manager.place_aster_market_order(
-                        self.order_manager.current_aster_side,
-                        self.order_manager.current_aster_quantity,
-                        self.order_manager.current_aster_price,
-                        self.stop_flag
-                    )
-                break
-
-            await asyncio.sleep(0.01)
-            if time.time() - start_time > 180:
-                self.logger.error("❌ Timeout waiting for trade completion")
-                break
+        return await self._execute_trade('sell')
 
     async def run(self):
         """Run the arbitrage bot."""
@@ -4,77 +4,139 @@ import logging
 from decimal import Decimal
 from typing import Tuple, Optional
 
+from sortedcontainers import SortedDict
+
+# Fixed-point price representation: prices become ints in 1e-8 units at
+# ingest and stay ints through book updates, BBO tracking and spread
+# math - int compares and subtracts instead of Decimal ones. Both venues
+# share the scale so cross-venue spreads are plain int differences;
+# Decimal reappears only at the API boundaries (logging, order sizing).
+PRICE_SCALE = 10 ** 8
+PRICE_UNIT = Decimal('1E-8')
+
 
 class OrderBookManager:
-    """Manages order book state for both exchanges."""
+    """Manages order book state for both exchanges.
+
+    Prices are held as integer multiples of PRICE_UNIT; sizes as floats
+    (they only feed zero-checks and diagnostics). Use to_price() or the
+    *_bbo_decimal() accessors to get Decimal prices back out.
+    """
 
     def __init__(self, logger: logging.Logger):
         """Initialize order book manager."""
         self.logger = logger
 
-        # GRVT order book state  
-        self.grvt_order_book = {'bids': {}, 'asks': {}}
-        self.grvt_best_bid: Optional[Decimal] = None
-        self.grvt_best_ask: Optional[Decimal] = None
+        # GRVT order book state. Sorted maps keep the best level at a
+        # known end, so BBO reads are O(log N) instead of a key scan
+        self.grvt_order_book = {'bids': SortedDict(), 'asks': SortedDict()}
+        self.grvt_best_bid: Optional[int] = None
+        self.grvt_best_ask: Optional[int] = None
         self.grvt_order_book_ready = False
 
         # Aster order book state
-        self.aster_order_book = {"bids": {}, "asks": {}}
-        self.aster_best_bid: Optional[Decimal] = None
-        self.aster_best_ask: Optional[Decimal] = None
+        self.aster_order_book = {"bids": SortedDict(), "asks": SortedDict()}
+        self.aster_best_bid: Optional[int] = None
+        self.aster_best_ask: Optional[int] = None
         self.aster_order_book_ready = False
         self.aster_order_book_lock = asyncio.Lock()
 
+        # Set whenever the top of book changes on either venue, so the
+        # trading loop can park on it instead of polling; readers clear
+        # it after consuming
+        self.bbo_update_event = asyncio.Event()
+
+        # One-shot readiness events mirroring the *_order_book_ready
+        # flags, so startup can await them instead of polling
+        self.grvt_ready_event = asyncio.Event()
+        self.aster_ready_event = asyncio.Event()
+
     # GRVT order book methods
     def update_grvt_order_book(self, bids: list, asks: list):
         """Update GRVT order book with new levels.
         
         Note: GRVT 'book.d' stream sends incremental updates (deltas).
         Size = 0 means remove that price level, size > 0 means add/update.
+
+        BBO is tracked incrementally: most deltas touch levels away from
+        the top of book, so the best only needs recomputing when the
+        current best level itself is removed.
         """
-        # Update bids (incremental mode)
+        bid_book = self.grvt_order_book['bids']
+        ask_book = self.grvt_order_book['asks']
+        best_bid = self.grvt_best_bid
+        best_ask = self.grvt_best_ask
+        bid_dirty = best_bid is None
+        ask_dirty = best_ask is None
+
+        # Update bids (incremental mode; one str->float->int conversion
+        # per level instead of a Decimal construction)
         for bid in bids:
-            price = Decimal(bid['price'])
-            size = Decimal(bid['size'])
+            price = int(round(float(bid['price']) * PRICE_SCALE))
+            size = float(bid['size'])
             if size > 0:
-                self.grvt_order_book['bids'][price] = size
+                bid_book[price] = size
+                if not bid_dirty and price > best_bid:
+                    best_bid = price
             else:
                 # Size = 0 means remove this price level
-                self.grvt_order_book['bids'].pop(price, None)
+                bid_book.pop(price, None)
+                if not bid_dirty and price == best_bid:
+                    bid_dirty = True
 
         # Update asks (incremental mode)
         for ask in asks:
-            price = Decimal(ask['price'])
-            size = Decimal(ask['size'])
+            price = int(round(float(ask['price']) * PRICE_SCALE))
+            size = float(ask['size'])
             if size > 0:
-                self.grvt_order_book['asks'][price] = size
+                ask_book[price] = size
+                if not ask_dirty and price < best_ask:
+                    best_ask = price
             else:
                 # Size = 0 means remove this price level
-                self.grvt_order_book['asks'].pop(price, None)
+                ask_book.pop(price, None)
+                if not ask_dirty and price == best_ask:
+                    ask_dirty = True
 
-        # Update best bid and ask
-        if self.grvt_order_book['bids']:
-            self.grvt_best_bid = max(self.grvt_order_book['bids'].keys())
-        else:
-            self.grvt_best_bid = None
-            
-        if self.grvt_order_book['asks']:
-            self.grvt_best_ask = min(self.grvt_order_book['asks'].keys())
-        else:
-            self.grvt_best_ask = None
+        # Recompute from the sorted maps only where the best was removed
+        if bid_dirty:
+            best_bid = bid_book.keys()[-1] if bid_book else None
+        if ask_dirty:
+            best_ask = ask_book.keys()[0] if ask_book else None
+
+        old_bbo = (self.grvt_best_bid, self.grvt_best_ask)
+        self.grvt_best_bid = best_bid
+        self.grvt_best_ask = best_ask
+
+        if (best_bid, best_ask) != old_bbo:
+            self.bbo_update_event.set()
 
         if not self.grvt_order_book_ready:
             self.grvt_order_book_ready = True
-            self.logger.info(f"📊 GRVT order book ready - Best bid: {self.grvt_best_bid}, "
-                             f"Best ask: {self.grvt_best_ask}")
+            self.grvt_ready_event.set()
+            self.logger.info(f"📊 GRVT order book ready - Best bid: {self.to_price(best_bid)}, "
+                             f"Best ask: {self.to_price(best_ask)}")
         else:
-            self.logger.debug(f"📊 GRVT order book updated - Best bid: {self.grvt_best_bid}, "
-                              f"Best ask: {self.grvt_best_ask}")
+            # Raw tick values: this fires on every delta, so no Decimal
+            # conversion and no eager formatting
+            self.logger.debug(
+                "📊 GRVT order book updated - Best bid: %s, Best ask: %s (1e-8 units)",
+                best_bid, best_ask)
+
+    def to_price(self, ticks: Optional[int]) -> Optional[Decimal]:
+        """Convert an internal integer price back to a Decimal."""
+        if ticks is None:
+            return None
+        return Decimal(ticks) * PRICE_UNIT
 
-    def get_grvt_bbo(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
-        """Get GRVT best bid/ask prices."""
+    def get_grvt_bbo(self) -> Tuple[Optional[int], Optional[int]]:
+        """Get GRVT best bid/ask prices in integer 1e-8 units."""
         return self.grvt_best_bid, self.grvt_best_ask
 
+    def get_grvt_bbo_decimal(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        """Get GRVT best bid/ask prices as Decimals."""
+        return self.to_price(self.grvt_best_bid), self.to_price(self.grvt_best_ask)
+
     # Aster order book methods
     async def reset_aster_order_book(self):
         """Reset Aster order book state."""
@@ -85,46 +147,80 @@ class OrderBookManager:
             self.aster_best_ask = None
 
     def update_aster_order_book(self, bids: list, asks: list):
-        """Update Aster order book with new bid and ask levels."""
+        """Update Aster order book with new bid and ask levels.
+
+        BBO is tracked incrementally like the GRVT book: a full
+        recompute only happens when the current best level is removed.
+        """
+        bid_book = self.aster_order_book["bids"]
+        ask_book = self.aster_order_book["asks"]
+        best_bid = self.aster_best_bid
+        best_ask = self.aster_best_ask
+        bid_dirty = best_bid is None
+        ask_dirty = best_ask is None
+
         # Update bids
         for level in bids:
             # Handle different data structures - could be list [price, size] or dict {"price": ..., "size": ...}
             if isinstance(level, list) and len(level) >= 2:
-                price = Decimal(level[0])
-                size = Decimal(level[1])
+                price = int(round(float(level[0]) * PRICE_SCALE))
+                size = float(level[1])
             elif isinstance(level, dict):
-                price = Decimal(level.get("price", 0))
-                size = Decimal(level.get("size", 0))
+                price = int(round(float(level.get("price", 0)) * PRICE_SCALE))
+                size = float(level.get("size", 0))
             else:
                 self.logger.warning(f"⚠️ Unexpected bid level format: {level}")
                 continue
 
             if size > 0:
-                self.aster_order_book["bids"][price] = size
+                bid_book[price] = size
+                if not bid_dirty and price > best_bid:
+                    best_bid = price
             else:
                 # Remove zero size orders
-                self.aster_order_book["bids"].pop(price, None)
+                bid_book.pop(price, None)
+                if not bid_dirty and price == best_bid:
+                    bid_dirty = True
 
         # Update asks
         for level in asks:
             if isinstance(level, list) and len(level) >= 2:
-                price = Decimal(level[0])
-                size = Decimal(level[1])
+                price = int(round(float(level[0]) * PRICE_SCALE))
+                size = float(level[1])
             elif isinstance(level, dict):
-                price = Decimal(level.get("price", 0))
-                size = Decimal(level.get("size", 0))
+                price = int(round(float(level.get("price", 0)) * PRICE_SCALE))
+                size = float(level.get("size", 0))
             else:
                 self.logger.warning(f"⚠️ Unexpected ask level format: {level}")
                 continue
 
             if size > 0:
-                self.aster_order_book["asks"][price] = size
+                ask_book[price] = size
+                if not ask_dirty and price < best_ask:
+                    best_ask = price
             else:
                 # Remove zero size orders
-                self.aster_order_book["asks"].pop(price, None)
+                ask_book.pop(price, None)
+                if not ask_dirty and price == best_ask:
+                    ask_dirty = True
+
+        if bid_dirty or ask_dirty:
+            # Fall back to the full recompute from the sorted maps
+            self.update_aster_bbo()
+            return
+
+        old_bbo = (self.aster_best_bid, self.aster_best_ask)
+        self.aster_best_bid = best_bid
+        self.aster_best_ask = best_ask
 
-        # Update BBO after processing all levels
-        self.update_aster_bbo()
+        if (best_bid, best_ask) != old_bbo:
+            self.bbo_update_event.set()
+
+        if not self.aster_order_book_ready and best_bid and best_ask:
+            self.aster_order_book_ready = True
+            self.aster_ready_event.set()
+            self.logger.info(f"📊 Aster order book ready - Best bid: {self.to_price(best_bid)}, "
+                             f"Best ask: {self.to_price(best_ask)}")
 
     def validate_order_book_integrity(self) -> bool:
         """Validate order book integrity."""
@@ -136,44 +232,56 @@ class OrderBookManager:
                     return False
         return True
 
-    def get_aster_best_levels(self) -> Tuple[Optional[Tuple[Decimal, Decimal]],
-                                              Optional[Tuple[Decimal, Decimal]]]:
-        """Get best bid and ask levels from Aster order book."""
+    def get_aster_best_levels(self) -> Tuple[Optional[Tuple[int, float]],
+                                              Optional[Tuple[int, float]]]:
+        """Get best bid/ask (price, size) levels from the Aster book.
+
+        Prices are in integer 1e-8 units, sizes are floats.
+        """
         best_bid = None
         best_ask = None
 
         if self.aster_order_book["bids"]:
-            best_bid_price = max(self.aster_order_book["bids"].keys())
+            best_bid_price = self.aster_order_book["bids"].keys()[-1]
             best_bid_size = self.aster_order_book["bids"][best_bid_price]
             best_bid = (best_bid_price, best_bid_size)
 
         if self.aster_order_book["asks"]:
-            best_ask_price = min(self.aster_order_book["asks"].keys())
+            best_ask_price = self.aster_order_book["asks"].keys()[0]
             best_ask_size = self.aster_order_book["asks"][best_ask_price]
             best_ask = (best_ask_price, best_ask_size)
 
         return best_bid, best_ask
 
-    def get_aster_bbo(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
-        """Get Aster best bid/ask prices."""
+    def get_aster_bbo(self) -> Tuple[Optional[int], Optional[int]]:
+        """Get Aster best bid/ask prices in integer 1e-8 units."""
         return self.aster_best_bid, self.aster_best_ask
 
+    def get_aster_bbo_decimal(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        """Get Aster best bid/ask prices as Decimals."""
+        return self.to_price(self.aster_best_bid), self.to_price(self.aster_best_ask)
+
     def update_aster_bbo(self):
         """Update Aster best bid and ask prices."""
+        old_bbo = (self.aster_best_bid, self.aster_best_ask)
         if self.aster_order_book["bids"]:
-            self.aster_best_bid = max(self.aster_order_book["bids"].keys())
+            self.aster_best_bid = self.aster_order_book["bids"].keys()[-1]
         else:
             self.aster_best_bid = None
 
         if self.aster_order_book["asks"]:
-            self.aster_best_ask = min(self.aster_order_book["asks"].keys())
+            self.aster_best_ask = self.aster_order_book["asks"].keys()[0]
         else:
             self.aster_best_ask = None
 
+        if (self.aster_best_bid, self.aster_best_ask) != old_bbo:
+            self.bbo_update_event.set()
+
         if not self.aster_order_book_ready and self.aster_best_bid and self.aster_best_ask:
             self.aster_order_book_ready = True
-            self.logger.info(f"📊 Aster order book ready - Best bid: {self.aster_best_bid}, "
-                             f"Best ask: {self.aster_best_ask}")
+            self.aster_ready_event.set()
+            self.logger.info(f"📊 Aster order book ready - Best bid: {self.to_price(self.aster_best_bid)}, "
+                             f"Best ask: {self.to_price(self.aster_best_ask)}")
 
     def get_aster_mid_price(self) -> Decimal:
         """Get mid price from Aster order book."""
@@ -182,5 +290,5 @@ class OrderBookManager:
         if best_bid is None or best_ask is None:
             raise Exception("Cannot calculate mid price - missing order book data")
 
-        mid_price = (best_bid[0] + best_ask[0]) / Decimal('2')
+        mid_price = Decimal(best_bid[0] + best_ask[0]) * PRICE_UNIT / 2
         return mid_price
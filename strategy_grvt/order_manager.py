@@ -1,12 +1,15 @@
 """Order placement and monitoring for GRVT and Aster exchanges."""
 import asyncio
 import logging
-import time
 from decimal import Decimal
 from typing import Optional, Callable, Any
 from exchanges.grvt import GrvtClient
 from exchanges.aster import AsterClient
 
+# Branch-free side mappings for the order-update hot path
+_OPPOSITE_SIDE = {'buy': 'sell', 'sell': 'buy'}
+_ASTER_ORDER_TYPE = {'buy': 'CLOSE', 'sell': 'OPEN'}
+
 
 class OrderManager:
     """Manages order placement and monitoring for both exchanges."""
@@ -37,6 +40,11 @@ class OrderManager:
         # Order execution tracking
         self.order_execution_complete = False
         self.waiting_for_aster_fill = False
+
+        # Event mirrors of the flags above, so trade executors can await
+        # the callback path instead of polling the bools
+        self.execution_complete_event = asyncio.Event()
+        self.aster_fill_ready_event = asyncio.Event()
         self.current_aster_side: Optional[str] = None
         self.current_aster_quantity: Optional[Decimal] = None
         self.current_aster_price: Optional[Decimal] = None
@@ -75,7 +83,7 @@ class OrderManager:
         
         if best_bid <= 0 or best_ask <= 0 or best_bid >= best_ask:
             # Fallback to WebSocket data if REST fails
-            grvt_bid, grvt_ask = self.order_book_manager.get_grvt_bbo()
+            grvt_bid, grvt_ask = self.order_book_manager.get_grvt_bbo_decimal()
             if grvt_bid and grvt_ask and grvt_bid > 0 and grvt_ask > 0 and grvt_bid < grvt_ask:
                 return grvt_bid, grvt_ask
             raise Exception("Invalid BBO prices from GRVT")
@@ -119,13 +127,16 @@ class OrderManager:
         self.logger.info(f"[OPEN] [GRVT] [{side}] Placing GRVT POST-ONLY order")
         order_id = await self.place_bbo_order(side, quantity)
 
-        start_time = time.time()
+        # Monotonic deadline: immune to NTP jumps, and loop.time() avoids
+        # a wall-clock syscall per poll
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 5
         while not stop_flag:
             if self.grvt_order_status == 'CANCELED':
                 return False
             elif self.grvt_order_status in ['OPEN', 'PENDING', 'PARTIALLY_FILLED']:
                 await asyncio.sleep(0.5)
-                if time.time() - start_time > 5:
+                if loop.time() > deadline:
                     try:
                         cancel_result = await self.grvt_client.cancel_order(order_id)
                         if not cancel_result.success:
@@ -148,15 +159,13 @@ class OrderManager:
         filled_size = order_data.get('filled_size')
         price = order_data.get('price', '0')
 
-        if side == 'buy':
-            aster_side = 'sell'
-        else:
-            aster_side = 'buy'
+        aster_side = _OPPOSITE_SIDE.get(side, 'buy')
 
         self.current_aster_side = aster_side
         self.current_aster_quantity = filled_size
         self.current_aster_price = Decimal(price)
         self.waiting_for_aster_fill = True
+        self.aster_fill_ready_event.set()
 
     def update_grvt_order_status(self, status: str):
         """Update GRVT order status."""
@@ -168,10 +177,7 @@ class OrderManager:
         if not self.aster_client or not self.aster_contract_id:
             raise Exception("Aster client not initialized")
 
-        if aster_side.lower() == 'buy':
-            order_type = "CLOSE"
-        else:
-            order_type = "OPEN"
+        order_type = _ASTER_ORDER_TYPE.get(aster_side.lower(), 'OPEN')
 
         self.aster_order_filled = False
 
@@ -208,6 +214,7 @@ class OrderManager:
 
             self.aster_order_filled = True
             self.order_execution_complete = True
+            self.execution_complete_event.set()
 
             return order_id
         except Exception as e:
@@ -238,6 +245,7 @@ class OrderManager:
 
             self.aster_order_filled = True
             self.order_execution_complete = True
+            self.execution_complete_event.set()
 
         except Exception as e:
             self.logger.error(f"Error handling Aster order result: {e}")
@@ -1,9 +1,8 @@
 """WebSocket management for GRVT and Aster exchanges."""
 import asyncio
-import json
 import logging
 import time
-import traceback
+import orjson
 import websockets
 from typing import Callable, Optional
 from decimal import Decimal
@@ -59,7 +58,7 @@ class WebSocketManagerWrapper:
             
             # Message comes directly as dict from SDK
             if isinstance(message, str):
-                message = json.loads(message)
+                message = orjson.loads(message)
 
             # GRVT order book messages have 'feed' key containing the data
             if 'feed' in message:
@@ -95,10 +94,9 @@ class WebSocketManagerWrapper:
 
                 self.order_book_manager.update_grvt_order_book(formatted_bids, formatted_asks)
 
-        except Exception as e:
-            self.logger.error(f"Error handling GRVT order book update: {e}")
-            self.logger.error(f"Message content: {message}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error handling GRVT order book update")
+            self.logger.error("Message content: %s", message)
 
     async def setup_grvt_websocket(self):
         """Setup GRVT websocket for order book data with monitoring."""
@@ -151,9 +149,8 @@ class WebSocketManagerWrapper:
             # Wait a bit for subscription to establish and first messages to arrive
             await asyncio.sleep(3)
 
-        except Exception as e:
-            self.logger.error(f"Error subscribing to GRVT order book: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error subscribing to GRVT order book")
             raise
 
     async def _monitor_grvt_connection(self):
@@ -202,9 +199,8 @@ class WebSocketManagerWrapper:
                         await self._reconnect_grvt_websocket()
                         self.logger.info("✅ GRVT WebSocket reconnected successfully")
                         consecutive_failures = 0  # Reset on success
-                    except Exception as e:
-                        self.logger.error(f"❌ Failed to reconnect GRVT WebSocket: {e}")
-                        self.logger.error(traceback.format_exc())
+                    except Exception:
+                        self.logger.exception("❌ Failed to reconnect GRVT WebSocket")
                         # Wait before next attempt (exponential backoff)
                         wait_time = min(5 * consecutive_failures, 30)
                         self.logger.info(f"⏳ Waiting {wait_time}s before next reconnection attempt...")
@@ -217,9 +213,8 @@ class WebSocketManagerWrapper:
             except asyncio.CancelledError:
                 self.logger.info("🔌 GRVT WebSocket monitor task cancelled")
                 break
-            except Exception as e:
-                self.logger.error(f"Error in GRVT WebSocket monitor: {e}")
-                self.logger.error(traceback.format_exc())
+            except Exception:
+                self.logger.exception("Error in GRVT WebSocket monitor")
                 await asyncio.sleep(5)
 
     async def _reconnect_grvt_websocket(self):
@@ -258,9 +253,8 @@ class WebSocketManagerWrapper:
             
             self.logger.info("✅ GRVT WebSocket reconnection completed")
             
-        except Exception as e:
-            self.logger.error(f"Error during GRVT WebSocket reconnection: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error during GRVT WebSocket reconnection")
             raise
 
     def start_grvt_websocket_monitor(self):
@@ -274,7 +268,7 @@ class WebSocketManagerWrapper:
         """Handle Aster order book updates from WebSocket."""
         try:
             if isinstance(message, str):
-                message = json.loads(message)
+                message = orjson.loads(message)
 
             self.logger.debug(f"Received Aster book message: {message}")
 
@@ -309,10 +303,9 @@ class WebSocketManagerWrapper:
 
                 self.order_book_manager.update_aster_order_book(formatted_bids, formatted_asks)
 
-        except Exception as e:
-            self.logger.error(f"Error handling Aster order book update: {e}")
-            self.logger.error(f"Message content: {message}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error handling Aster order book update")
+            self.logger.error("Message content: %s", message)
 
     async def handle_aster_ws(self):
         """Handle Aster WebSocket connection and messages."""
@@ -332,8 +325,8 @@ class WebSocketManagerWrapper:
                             msg = await asyncio.wait_for(ws.recv(), timeout=30)
 
                             try:
-                                data = json.loads(msg)
-                            except json.JSONDecodeError as e:
+                                data = orjson.loads(msg)
+                            except orjson.JSONDecodeError as e:
                                 self.logger.warning(f"⚠️ Aster JSON parsing error: {e}")
                                 continue
 
@@ -349,14 +342,12 @@ class WebSocketManagerWrapper:
                         except websockets.exceptions.ConnectionClosed as e:
                             self.logger.warning(f"⚠️ Aster websocket connection closed: {e}")
                             break
-                        except Exception as e:
-                            self.logger.error(f"⚠️ Error in Aster websocket: {e}")
-                            self.logger.error(traceback.format_exc())
+                        except Exception:
+                            self.logger.exception("⚠️ Error in Aster websocket")
                             break
 
-            except Exception as e:
-                self.logger.error(f"⚠️ Failed to connect to Aster websocket: {e}")
-                self.logger.error(traceback.format_exc())
+            except Exception:
+                self.logger.exception("⚠️ Failed to connect to Aster websocket")
 
             if not self.stop_flag:
                 self.logger.info("🔄 Reconnecting to Aster WebSocket in 2 seconds...")